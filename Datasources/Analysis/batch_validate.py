@@ -0,0 +1,227 @@
+import argparse
+import time
+
+import numpy as np
+
+from ..ValidateMove.util.bitboard import DIRECTIONS, JUMPS, NEIGHBOURS, PIECE_DIRECTIONS
+from ..ValidateMove.util.validate_move import MoveValidator
+from .self_play import self_play_transitions
+
+VALID = 0
+MALFORMED_STATE = 1
+NOT_PLAYERS_TURN = 2
+NOT_A_SINGLE_MOVE = 3
+CAPTURE_REQUIRED = 4
+ILLEGAL_MOVE = 5
+WRONG_RESULTING_STATE = 6
+
+REASONS = {
+    VALID: "VALID",
+    MALFORMED_STATE: "MALFORMED_STATE",
+    NOT_PLAYERS_TURN: "NOT_PLAYERS_TURN",
+    NOT_A_SINGLE_MOVE: "NOT_A_SINGLE_MOVE",
+    CAPTURE_REQUIRED: "CAPTURE_REQUIRED",
+    ILLEGAL_MOVE: "ILLEGAL_MOVE",
+    WRONG_RESULTING_STATE: "WRONG_RESULTING_STATE"
+}
+
+STATE_WIDTH = 35
+OFF_BOARD = 32
+# Value of the padding square that stands in for every off-board neighbour, neither a piece nor empty
+BLOCKED = 9
+
+
+def _index_table(squares_by_direction):
+    # direction x square, with the padding square as one more square whose neighbours are all off the board
+    return np.array([[OFF_BOARD if square is None else square for square in squares_by_direction[direction]]
+                     + [OFF_BOARD] for direction in DIRECTIONS], dtype=np.intp)
+
+
+NEIGHBOUR_INDEX = _index_table(NEIGHBOURS)
+JUMP_CAPTURED_INDEX = _index_table({direction: [None if jump is None else jump[0] for jump in JUMPS[direction]]
+                                    for direction in DIRECTIONS})
+JUMP_LANDING_INDEX = _index_table({direction: [None if jump is None else jump[1] for jump in JUMPS[direction]]
+                                   for direction in DIRECTIONS})
+# direction x piece type -> whether that piece moves in that direction
+ALLOWED_DIRECTIONS = np.array([[direction in PIECE_DIRECTIONS.get(piece_type, ()) for piece_type in range(BLOCKED + 1)]
+                               for direction in DIRECTIONS])
+IS_WHITE = np.zeros(BLOCKED + 1, dtype=bool)
+IS_WHITE[[1, 2]] = True
+IS_BLACK = np.zeros(BLOCKED + 1, dtype=bool)
+IS_BLACK[[3, 4]] = True
+
+
+def encode_states(states):
+    # Fixed-width rows of digit values, one per state, with the real lengths kept alongside
+    lengths = np.fromiter(map(len, states), dtype=np.intp, count=len(states))
+    code_points = np.asarray(states, dtype=f"U{STATE_WIDTH}").view(np.uint32).reshape(len(states), STATE_WIDTH)
+    characters = np.clip(code_points, 0, 0x7F).astype(np.int16) - ord("0")
+    return characters, lengths
+
+
+def _padded_board(characters):
+    board = np.full((characters.shape[0], OFF_BOARD + 1), BLOCKED, dtype=np.int16)
+    board[:, :OFF_BOARD] = characters[:, :OFF_BOARD]
+    return board
+
+
+def _parse_continuation(characters, lengths):
+    # Mirrors int(state[33:]) for the one and two digit squares the engine writes
+    first = characters[:, 33]
+    second = characters[:, 34]
+    first_digit = (first >= 0) & (first <= 9)
+    second_digit = (second >= 0) & (second <= 9)
+    value = np.where(lengths == 35, first * 10 + second, first)
+    parsed = ((lengths == 34) & first_digit) | ((lengths == 35) & first_digit & second_digit)
+    return value, parsed
+
+
+def _can_capture(board, rows, squares, piece_types):
+    # Whether the piece type on each row's square has a capture, judged on that row's board
+    captured = board[rows[:, None], JUMP_CAPTURED_INDEX[:, squares].T]
+    landing = board[rows[:, None], JUMP_LANDING_INDEX[:, squares].T]
+    captures_white = IS_BLACK[piece_types][:, None] & IS_WHITE[captured]
+    captures_black = IS_WHITE[piece_types][:, None] & IS_BLACK[captured]
+    allowed = ALLOWED_DIRECTIONS[:, piece_types].T
+    return (allowed & (captures_white | captures_black) & (landing == 0)).any(axis=1)
+
+
+def _side_can_capture(board, is_black):
+    pieces = board[:, :OFF_BOARD]
+    own = np.where(is_black[:, None], IS_BLACK[pieces], IS_WHITE[pieces])
+    result = np.zeros(board.shape[0], dtype=bool)
+    for direction in range(len(DIRECTIONS)):
+        captured = board[:, JUMP_CAPTURED_INDEX[direction, :OFF_BOARD]]
+        landing = board[:, JUMP_LANDING_INDEX[direction, :OFF_BOARD]]
+        movers = own & ALLOWED_DIRECTIONS[direction][pieces]
+        opponent = np.where(is_black[:, None], IS_WHITE[captured], IS_BLACK[captured])
+        result |= (movers & opponent & (landing == 0)).any(axis=1)
+    return result
+
+
+def validate_batch(old_states, new_states, colors):
+    old_characters, old_lengths = encode_states(old_states)
+    new_characters, new_lengths = encode_states(new_states)
+    colors = np.asarray(colors, dtype=str)
+    count = len(old_lengths)
+    rows = np.arange(count)
+    reasons = np.full(count, VALID, dtype=np.int8)
+
+    def reject(mask, reason):
+        reasons[(reasons == VALID) & mask] = reason
+
+    old_board = _padded_board(old_characters)
+    new_board = _padded_board(new_characters)
+    old_turn = old_characters[:, 32]
+    is_black = colors == "black"
+    is_white = colors == "white"
+    continuation_turn = (old_turn == 2) | (old_turn == 3)
+    continuation_square, continuation_parsed = _parse_continuation(old_characters, old_lengths)
+
+    old_pieces = old_board[:, :OFF_BOARD]
+    new_pieces = new_board[:, :OFF_BOARD]
+    old_malformed = (old_lengths < 33) | (old_lengths > STATE_WIDTH) | ((old_pieces < 0) | (old_pieces > 4)).any(axis=1) \
+        | (old_turn < 0) | (old_turn > 3) | (continuation_turn & ~continuation_parsed)
+    new_malformed = (new_lengths < 32) | ((new_pieces < 0) | (new_pieces > 4)).any(axis=1)
+    reject(old_malformed | new_malformed, MALFORMED_STATE)
+    # Malformed rows are checked against an empty board from here on so indexing stays in range
+    old_board[old_malformed] = 0
+    old_board[old_malformed, OFF_BOARD] = BLOCKED
+    new_board[new_malformed] = 0
+    new_board[new_malformed, OFF_BOARD] = BLOCKED
+    old_pieces = old_board[:, :OFF_BOARD]
+    new_pieces = new_board[:, :OFF_BOARD]
+
+    turn_ok = (is_black & ((old_turn == 0) | (old_turn == 2))) | (is_white & ((old_turn == 1) | (old_turn == 3)))
+    reject(~turn_ok, NOT_PLAYERS_TURN)
+
+    # Decode the single hop from the board difference
+    old_occupied = old_pieces > 0
+    new_occupied = new_pieces > 0
+    arrived = new_occupied & ~old_occupied
+    vacated = old_occupied & ~new_occupied
+    end = arrived.argmax(axis=1)
+    end_piece = new_pieces[rows, end]
+    mover_white = IS_WHITE[end_piece]
+    own_old = np.where(mover_white[:, None], IS_WHITE[old_pieces], IS_BLACK[old_pieces])
+    start_squares = vacated & own_old
+    captured_squares = vacated & ~own_old
+    start = start_squares.argmax(axis=1)
+    has_capture = captured_squares.any(axis=1)
+    captured = np.where(has_capture, captured_squares.argmax(axis=1), OFF_BOARD)
+    untouched = (old_pieces == new_pieces) | arrived | vacated
+    single_move = (arrived.sum(axis=1) == 1) & (start_squares.sum(axis=1) == 1) \
+        & (captured_squares.sum(axis=1) <= 1) & untouched.all(axis=1)
+    reject(~single_move, NOT_A_SINGLE_MOVE)
+
+    piece_type = old_pieces[rows, start]
+    allowed = ALLOWED_DIRECTIONS[:, piece_type]
+    step_matches = (NEIGHBOUR_INDEX[:, start] == end) & ~has_capture
+    jump_matches = (JUMP_CAPTURED_INDEX[:, start] == captured) & (JUMP_LANDING_INDEX[:, start] == end) & has_capture
+    geometry = (allowed & (step_matches | jump_matches)).any(axis=0)
+
+    # A continuing piece must keep capturing; otherwise any capture on the board is forced
+    continuation_square = np.where(continuation_turn & (continuation_square >= 0) & (continuation_square < OFF_BOARD),
+                                   continuation_square, OFF_BOARD)
+    continuation_piece = old_board[rows, continuation_square]
+    continuation_captures = _can_capture(old_board, rows, continuation_square, continuation_piece)
+    in_continuation = continuation_captures & (start == continuation_square) & has_capture & geometry
+    reject(continuation_captures & ~in_continuation, CAPTURE_REQUIRED)
+    # Only rows still in the running with a quiet move need the whole board scanned for captures
+    quiet = (reasons == VALID) & ~continuation_captures & ~has_capture
+    capture_required = np.zeros(count, dtype=bool)
+    capture_required[quiet] = _side_can_capture(old_board[quiet], is_black[quiet])
+    reject(capture_required, CAPTURE_REQUIRED)
+    own_piece = np.where(is_black, IS_BLACK[piece_type], IS_WHITE[piece_type])
+    reject(~continuation_captures & ~(own_piece & geometry), ILLEGAL_MOVE)
+
+    # Rebuild the piece, turn code and continuation square the engine would write
+    promoted = ((piece_type == 1) & (end >= 28)) | ((piece_type == 3) & (end <= 3))
+    expected_piece = np.where(promoted, piece_type + 1, piece_type)
+    continues = has_capture & _can_capture(old_board, rows, end, piece_type)
+    expected_turn = np.where(is_black, np.where(continues, 2, 1), np.where(continues, 3, 0))
+    expected_length = np.where(continues, np.where(end >= 10, 35, 34), 33)
+    tens = np.where(end >= 10, end // 10, end)
+    units = end % 10
+    suffix_ok = np.where(expected_length == 35,
+                         (new_characters[:, 33] == tens) & (new_characters[:, 34] == units),
+                         (expected_length == 33) | (new_characters[:, 33] == tens))
+    resulting_state = (new_pieces[rows, end] == expected_piece) & (new_characters[:, 32] == expected_turn) \
+        & (new_lengths == expected_length) & suffix_ok
+    reject(~resulting_state, WRONG_RESULTING_STATE)
+
+    return reasons == VALID, reasons
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Re-validate (old state, new state, colour) transitions in bulk")
+    parser.add_argument("--input", help="file with one 'oldState newState colour' transition per line")
+    parser.add_argument("--self-play", type=int, default=200, help="games of random play to validate without --input")
+    parser.add_argument("--check", action="store_true", help="compare every result with MoveValidator")
+    args = parser.parse_args()
+
+    if args.input:
+        with open(args.input) as transitions_file:
+            transitions = [tuple(line.split()) for line in transitions_file if line.strip()]
+    else:
+        transitions = list(self_play_transitions(args.self_play, invalid_per_move=3))
+    old_states, new_states, colors = zip(*transitions)
+
+    start = time.perf_counter()
+    valid, reasons = validate_batch(old_states, new_states, colors)
+    elapsed = time.perf_counter() - start
+    print(f"{len(transitions)} transitions in {elapsed:.3f}s, {len(transitions) / elapsed:.0f} transitions/s")
+    for reason, name in REASONS.items():
+        print(f"  {name:22} {(reasons == reason).sum()}")
+
+    if args.check:
+        start = time.perf_counter()
+        expected = [MoveValidator(old_state, color).validate_new_state(new_state)
+                    for old_state, new_state, color in transitions]
+        elapsed = time.perf_counter() - start
+        mismatches = int((np.array(expected) != valid).sum())
+        print(f"MoveValidator: {len(transitions) / elapsed:.0f} transitions/s, {mismatches} mismatches")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+import argparse
+import json
+import os
+import random
+import time
+
+from ..ValidateMove.util.bitboard import color_to_move, has_any_legal_move
+from ..ValidateMove.util.history import replay
+from ..ValidateMove.util.opening_book import ENTRY, HEADER, MAGIC, RESULTS, VERSION, OpeningBook
+from ..ValidateMove.util.zobrist import hash_state
+from .self_play import play_random_game
+
+
+def _game_from_item(item):
+    # Only finished games with a move list can be replayed, the legacy state set has lost its order
+    if "moveHistory" not in item or item.get("gameResult", {}).get("S") not in RESULTS:
+        return None
+    hops = [int(hop["N"]) for hop in item["moveHistory"]["L"]]
+    return replay(hops), item["gameResult"]["S"]
+
+
+def games_from_table(table_name="GameTable", region="eu-west-1"):
+    import boto3
+
+    paginator = boto3.client("dynamodb", region).get_paginator("scan")
+    pages = paginator.paginate(TableName=table_name, ProjectionExpression="moveHistory, gameResult")
+    for page in pages:
+        for item in page["Items"]:
+            game = _game_from_item(item)
+            if game is not None:
+                yield game
+
+
+def games_from_export(path):
+    # A DynamoDB export to S3 in JSON lines, one {"Item": ...} per line
+    with open(path) as export_file:
+        for line in export_file:
+            if line.strip():
+                game = _game_from_item(json.loads(line)["Item"])
+                if game is not None:
+                    yield game
+
+
+def games_from_self_play(games, seed=0, max_plies=300):
+    rng = random.Random(seed)
+    for _ in range(games):
+        states = play_random_game(rng, max_plies)
+        if has_any_legal_move(states[-1], color_to_move(states[-1])):
+            result = "TIE"
+        else:
+            result = "WHITE_WIN" if color_to_move(states[-1]) == "black" else "BLACK_WIN"
+        yield states, result
+
+
+def aggregate(games, plies):
+    # key -> games, white wins, black wins, ties, each game counted once per position however often it returns
+    statistics = {}
+    for states, result in games:
+        keys = set()
+        for ply, state in enumerate(states):
+            if ply > plies:
+                break
+            keys.add(hash_state(state))
+        result_index = RESULTS.index(result) + 1
+        for key in keys:
+            counts = statistics.setdefault(key, [0, 0, 0, 0])
+            counts[0] += 1
+            counts[result_index] += 1
+    return statistics
+
+
+def write_book(path, statistics, plies, min_games=1):
+    keys = sorted(key for key, counts in statistics.items() if counts[0] >= min_games)
+    # Written aside and renamed, so a server mapping the old book never sees half a file
+    temporary_path = path + ".tmp"
+    with open(temporary_path, "wb") as book_file:
+        book_file.write(HEADER.pack(MAGIC, VERSION, plies, len(keys)))
+        for key in keys:
+            book_file.write(ENTRY.pack(key, *statistics[key]))
+    os.replace(temporary_path, path)
+    return len(keys)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build an opening book from the first plies of finished games")
+    parser.add_argument("output", help="book file to write")
+    parser.add_argument("--export", help="DynamoDB JSON lines export of the game table")
+    parser.add_argument("--table", help="game table to scan")
+    parser.add_argument("--self-play", type=int, default=1000, help="games of random play without --export or --table")
+    parser.add_argument("--plies", type=int, default=16, help="deepest ply kept in the book")
+    parser.add_argument("--min-games", type=int, default=1, help="positions seen in fewer games are left out")
+    args = parser.parse_args()
+
+    if args.export:
+        games = games_from_export(args.export)
+    elif args.table:
+        games = games_from_table(args.table)
+    else:
+        games = games_from_self_play(args.self_play)
+
+    start = time.perf_counter()
+    statistics = aggregate(games, args.plies)
+    entries = write_book(args.output, statistics, args.plies, args.min_games)
+    print(f"{entries} positions written in {time.perf_counter() - start:.1f}s")
+
+    with OpeningBook(args.output) as book:
+        start = time.perf_counter()
+        for key in statistics:
+            book.probe_key(key)
+        print(f"{len(statistics) / (time.perf_counter() - start):.0f} probes/s")
+
+
+if __name__ == "__main__":
+    main()
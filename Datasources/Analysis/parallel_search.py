@@ -0,0 +1,74 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+from ..ValidateMove.util.bitboard import TURN_COLORS, Position, apply_move, find_packed_legal_moves
+from ..ValidateMove.util.search import INFINITY, SearchResult, Searcher
+
+# One searcher and one view of the shared alpha per worker process
+_searcher = None
+_shared_alpha = None
+
+
+def _initialise_worker(shared_alpha, table_bits):
+    global _searcher, _shared_alpha
+    _searcher = Searcher(table_bits=table_bits, exact_depth=True)
+    _shared_alpha = shared_alpha
+
+
+def _search_root_move(state, move, depth):
+    # One below the best score so far, so a move that ties with it still gets its exact score
+    alpha = _shared_alpha.value - 1
+    score = _searcher.search_move(state, move, depth, alpha)
+    with _shared_alpha.get_lock():
+        if score > _shared_alpha.value:
+            _shared_alpha.value = score
+    return score, _searcher.nodes
+
+
+class ParallelSearcher:
+    # Splits the root moves over a pool of processes that share the best score found so far. Workers keep their
+    # tables between moves, so they search with exact depth cutoffs to give the same result whichever worker runs what
+    def __init__(self, workers=None, table_bits=18):
+        self.workers = workers or multiprocessing.cpu_count()
+        self.shared_alpha = multiprocessing.Value("q", -INFINITY)
+        self.pool = ProcessPoolExecutor(self.workers, initializer=_initialise_worker,
+                                        initargs=(self.shared_alpha, table_bits))
+        self.ordering_searcher = Searcher(table_bits=table_bits, exact_depth=True)
+
+    def search(self, state, depth):
+        position = Position.from_state(state)
+        color = TURN_COLORS[position.turn]
+        moves = find_packed_legal_moves(position, color)
+        if not moves:
+            return None
+
+        # A shallow search puts the likely best move first, so alpha is high before most moves start
+        order = list(range(len(moves)))
+        if depth > 2:
+            ordering = self.ordering_searcher.search(state, depth - 2)
+            order.sort(key=lambda index: moves[index] != ordering.move)
+
+        with self.shared_alpha.get_lock():
+            self.shared_alpha.value = -INFINITY
+        futures = {index: self.pool.submit(_search_root_move, state, moves[index], depth) for index in order}
+        results = {index: future.result() for index, future in futures.items()}
+
+        # Highest score wins and ties go to the earliest generated move, whatever order the workers finished in
+        best_index = max(range(len(moves)), key=lambda index: (results[index][0], -index))
+        best_move = moves[best_index]
+        nodes = sum(move_nodes for _, move_nodes in results.values())
+        return SearchResult(best_move, apply_move(position, best_move, color).to_state(), results[best_index][0],
+                            depth, nodes)
+
+    def analyse_game(self, states, depth):
+        # Best move and score for every position of a finished game, skipping positions without a move
+        return [result for result in (self.search(state, depth) for state in states) if result is not None]
+
+    def close(self):
+        self.pool.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
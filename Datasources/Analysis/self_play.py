@@ -0,0 +1,39 @@
+import random
+
+from ..ValidateMove.util.bitboard import START_STATE, color_to_move, find_successor_states
+
+
+def play_random_game(rng, max_plies=300, start_state=START_STATE):
+    states = [start_state]
+    state = start_state
+    for _ in range(max_plies):
+        new_states = find_successor_states(state, color_to_move(state))
+        if not new_states:
+            break
+        state = rng.choice(new_states)
+        states.append(state)
+    return states
+
+
+def self_play_games(games, seed=0, max_plies=300):
+    rng = random.Random(seed)
+    for _ in range(games):
+        yield play_random_game(rng, max_plies)
+
+
+def self_play_transitions(games, seed=0, max_plies=300, invalid_per_move=0):
+    # Yields (old state, new state, requester colour) for every ply, plus corrupted copies of each played move
+    rng = random.Random(seed)
+    for states in self_play_games(games, seed, max_plies):
+        for old_state, new_state in zip(states, states[1:]):
+            color = color_to_move(old_state)
+            yield old_state, new_state, color
+            for _ in range(invalid_per_move):
+                yield old_state, _corrupt(rng, new_state), rng.choice(("white", "black"))
+
+
+def _corrupt(rng, state):
+    corrupted = list(state)
+    for _ in range(rng.randint(1, 2)):
+        corrupted[rng.randrange(len(corrupted))] = rng.choice("01234")
+    return "".join(corrupted)
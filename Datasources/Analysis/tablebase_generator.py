@@ -0,0 +1,257 @@
+import argparse
+import os
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from itertools import combinations, groupby
+
+import numpy as np
+
+from ..ValidateMove.util.bitboard import Position, find_complete_move_positions
+from ..ValidateMove.util.symmetry import flip_position
+from ..ValidateMove.util.tablebase import (BLACK_MAN_SQUARES, CANONICAL_FLAG, DRAW, HEADER, INVALID, MAGIC,
+                                           MAX_DISTANCE, VERSION, WHITE_MAN_SQUARES, Tablebase, flip_material,
+                                           loss_code, material_of, position_index, read_header, slice_file_name,
+                                           slice_size, win_code)
+
+# Marks a valid position the passes haven't resolved yet, never written to a file
+UNKNOWN = 255
+SIDES = (("0", "black"), ("1", "white"))
+
+
+def _squares(mask):
+    return [square for square in range(32) if mask >> square & 1]
+
+
+def _bits(squares):
+    bits = 0
+    for square in squares:
+        bits |= 1 << square
+    return bits
+
+
+def material_slices(max_pieces):
+    # Every material split with at least one piece a side, kings and men counted apart
+    slices = []
+    for white_pieces in range(1, max_pieces):
+        for black_pieces in range(1, max_pieces - white_pieces + 1):
+            for white_kings in range(white_pieces + 1):
+                for black_kings in range(black_pieces + 1):
+                    slices.append((white_pieces - white_kings, white_kings, black_pieces - black_kings, black_kings))
+    return slices
+
+
+def _level(material):
+    white_men, white_kings, black_men, black_kings = material
+    return white_men + white_kings + black_men + black_kings, white_men + black_men
+
+
+def slice_dependencies(material):
+    # The slice and every slice its positions can reach: a capture takes one man or king off either side as long as
+    # both keep a piece, a promotion turns a man of either side into a king
+    dependencies = set()
+    pending = [material]
+    while pending:
+        material = pending.pop()
+        if material in dependencies:
+            continue
+        dependencies.add(material)
+        white_men, white_kings, black_men, black_kings = material
+        white_pieces = white_men + white_kings
+        black_pieces = black_men + black_kings
+        if white_men:
+            pending.append((white_men - 1, white_kings + 1, black_men, black_kings))
+            if white_pieces > 1:
+                pending.append((white_men - 1, white_kings, black_men, black_kings))
+        if white_kings and white_pieces > 1:
+            pending.append((white_men, white_kings - 1, black_men, black_kings))
+        if black_men:
+            pending.append((white_men, white_kings, black_men - 1, black_kings + 1))
+            if black_pieces > 1:
+                pending.append((white_men, white_kings, black_men - 1, black_kings))
+        if black_kings and black_pieces > 1:
+            pending.append((white_men, white_kings, black_men, black_kings - 1))
+    return dependencies
+
+
+def slice_levels(slices):
+    # A capture drops into a level with fewer pieces and a promotion into one with fewer men, so each level only
+    # depends on the ones before it and the slices inside a level can be solved side by side
+    slices = sorted(slices, key=_level)
+    return [list(level) for _, level in groupby(slices, key=_level)]
+
+
+def enumerate_slice(material):
+    white_men, white_kings, black_men, black_kings = material
+    for white_men_squares in combinations(_squares(WHITE_MAN_SQUARES), white_men):
+        for black_men_squares in combinations(_squares(BLACK_MAN_SQUARES & ~_bits(white_men_squares)), black_men):
+            men = _bits(white_men_squares) | _bits(black_men_squares)
+            free_squares = _squares(~men & 0xFFFFFFFF)
+            for white_kings_squares in combinations(free_squares, white_kings):
+                white_kings_bits = _bits(white_kings_squares)
+                for black_kings_squares in combinations(_squares(~(men | white_kings_bits) & 0xFFFFFFFF), black_kings):
+                    black_kings_bits = _bits(black_kings_squares)
+                    white = _bits(white_men_squares) | white_kings_bits
+                    black = _bits(black_men_squares) | black_kings_bits
+                    for turn, color in SIDES:
+                        yield Position(white, black, white_kings_bits | black_kings_bits, turn), color
+
+
+def _successor_code(tablebase, material, successor):
+    # None for a successor in the slice being solved, otherwise its final value
+    if material_of(successor) == material:
+        return None
+    code = tablebase.probe_code(successor)
+    if code is None:
+        raise RuntimeError(f"Slice {slice_file_name(material_of(successor))} must be generated first")
+    return code
+
+
+def _slice_graph(directory, material, canonical):
+    # Flat move graph of the slice: the positions with moves, where each one's moves start in the edge buffer, and
+    # per move the index of a successor in this slice or minus the final code of a successor in a smaller one
+    tablebase = Tablebase(directory, canonical)
+    typecode = "i" if slice_size(material) < 1 << 31 else "q"
+    valid = array(typecode)
+    owners = array(typecode)
+    starts = array("q")
+    edges = array(typecode)
+    for position, color in enumerate_slice(material):
+        index = position_index(position)
+        valid.append(index)
+        start = len(edges)
+        for successor in find_complete_move_positions(position, color):
+            code = _successor_code(tablebase, material, successor)
+            edges.append(position_index(successor) if code is None else -code)
+        if len(edges) > start:
+            owners.append(index)
+            starts.append(start)
+    tablebase.close()
+    return (np.frombuffer(valid, dtype=typecode), np.frombuffer(owners, dtype=typecode),
+            np.frombuffer(starts, dtype=np.int64), np.frombuffer(edges, dtype=typecode))
+
+
+def solve_slice(directory, material, canonical=False):
+    valid, owners, starts, edges = _slice_graph(directory, material, canonical)
+    values = np.zeros(slice_size(material), dtype=np.uint8)
+    # Positions without a move are lost on the spot, the rest wait for the passes
+    values[valid] = loss_code(0)
+    values[owners] = UNKNOWN
+
+    internal = np.flatnonzero(edges >= 0)
+    successors = edges[internal]
+    external_codes = (-edges[edges < 0]).astype(np.uint8)
+    external_codes = external_codes[external_codes != DRAW]
+    longest_external = int(external_codes.max()) // 2 - 1 if len(external_codes) else 0
+    # Codes of every move's successor, the ones inside the slice are refreshed at the start of each pass
+    edge_codes = np.where(edges < 0, -edges, 0).astype(np.uint8)
+
+    # Pass d finds the wins and losses in d plies from the values of pass d - 1, every position at once
+    distance = 0
+    remaining = len(owners)
+    while remaining:
+        distance += 1
+        if distance > MAX_DISTANCE:
+            raise ValueError(f"Slice {slice_file_name(material)} has a result longer than {MAX_DISTANCE} plies")
+        edge_codes[internal] = values[successors]
+        pending = values[owners] == UNKNOWN
+        wins = pending & np.logical_or.reduceat(edge_codes == loss_code(distance - 1), starts)
+        # UNKNOWN and DRAW are both odd, so a position is only lost once every move is a known win for the opponent
+        losses = pending & ~wins & np.logical_and.reduceat(edge_codes % 2 == 0, starts) \
+            & (np.maximum.reduceat(edge_codes, starts) == win_code(distance - 1))
+        values[owners[wins]] = win_code(distance)
+        values[owners[losses]] = loss_code(distance)
+        remaining = int(pending.sum() - wins.sum() - losses.sum())
+        if not wins.any() and not losses.any() and distance > longest_external:
+            break
+
+    values[owners[values[owners] == UNKNOWN]] = DRAW
+    return bytearray(values)
+
+
+def slice_complete(directory, material, canonical=False):
+    # A canonical slice is solved together with its mirror, so both files have to be there
+    materials = {material, flip_material(material)} if canonical else {material}
+    for material in materials:
+        path = os.path.join(directory, slice_file_name(material))
+        if not os.path.exists(path):
+            return False
+        flags = CANONICAL_FLAG if canonical else 0
+        size = slice_size(material) // 2 if canonical else slice_size(material)
+        with open(path, "rb") as slice_file:
+            header = slice_file.read(HEADER.size)
+        try:
+            if read_header(header) != (material, flags, size) or os.path.getsize(path) != HEADER.size + size:
+                return False
+        except Exception:
+            return False
+    return True
+
+
+def _write_slice(directory, material, values, flags):
+    path = os.path.join(directory, slice_file_name(material))
+    # Written aside and renamed, so an interrupted run never leaves a file that looks complete
+    temporary_path = path + ".tmp"
+    with open(temporary_path, "wb") as slice_file:
+        slice_file.write(HEADER.pack(MAGIC, VERSION, *material, flags, len(values)))
+        slice_file.write(values)
+    os.replace(temporary_path, path)
+
+
+def generate_slice(directory, material, canonical=False):
+    values = solve_slice(directory, material, canonical)
+    if not canonical:
+        _write_slice(directory, material, values, 0)
+        return material, len(values) - values.count(INVALID)
+
+    # Positions with black to move are the mirror slice's positions with white to move
+    _write_slice(directory, material, values[1::2], CANONICAL_FLAG)
+    if flip_material(material) != material:
+        mirrored_values = bytearray(slice_size(material) // 2)
+        for position, _ in enumerate_slice(material):
+            if position.turn == "0":
+                mirrored_values[position_index(flip_position(position)) // 2] = values[position_index(position)]
+        _write_slice(directory, flip_material(material), mirrored_values, CANONICAL_FLAG)
+    return material, len(values) - values.count(INVALID)
+
+
+def generate(directory, max_pieces, workers=1, progress=None, canonical=False, targets=None):
+    # Slices already on disk are skipped, so a stopped run picks up where it left off
+    os.makedirs(directory, exist_ok=True)
+    if targets is None:
+        slices = material_slices(max_pieces)
+    else:
+        # Only the given slices and the ones they depend on, whatever their number of pieces
+        slices = sorted(set().union(*(slice_dependencies(material) for material in targets)))
+    if canonical:
+        slices = sorted({min(material, flip_material(material)) for material in slices})
+    with ProcessPoolExecutor(workers) as pool:
+        for level in slice_levels(slices):
+            missing = [material for material in level if not slice_complete(directory, material, canonical)]
+            for material, positions in pool.map(generate_slice, [directory] * len(missing), missing,
+                                                [canonical] * len(missing)):
+                if progress is not None:
+                    progress(material, positions)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Solve every endgame up to a number of pieces by retrograde analysis")
+    parser.add_argument("directory", help="where the slice files are written and looked up")
+    parser.add_argument("--pieces", type=int, default=4, help="largest number of pieces on the board")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="processes solving slices at once")
+    parser.add_argument("--canonical", action="store_true", help="store white to move only, black probes the mirror")
+    parser.add_argument("--slice", type=int, nargs=4, action="append", metavar=("W", "WK", "B", "BK"),
+                        help="generate only this slice and its dependencies, can be repeated")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+
+    def progress(material, positions):
+        print(f"{slice_file_name(material)}: {positions} positions after {time.perf_counter() - start:.1f}s")
+
+    targets = None if args.slice is None else [tuple(material) for material in args.slice]
+    generate(args.directory, args.pieces, args.workers, progress, args.canonical, targets)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+import numpy as np
+
+# Scores are from white's point of view, in the same units as the search's evaluation
+MAN_VALUE = 100
+KING_VALUE = 150
+ADVANCEMENT_VALUE = 3
+CENTRE_VALUE = 5
+BACK_RANK_VALUE = 8
+CENTRE_SQUARES = (9, 10, 13, 14, 17, 18, 21, 22)
+# Each side's home row, men left there stop the opponent promoting
+WHITE_BACK_RANK = (0, 1, 2, 3)
+BLACK_BACK_RANK = (28, 29, 30, 31)
+TERMS = ("material", "kings", "advancement", "centre", "back_rank")
+
+
+def boards_from_states(states):
+    # (N, 32) int8 boards holding the MoveValidator piece codes 0-4
+    boards = np.frombuffer("".join(state[:32] for state in states).encode("ascii"), dtype=np.uint8)
+    return (boards.reshape(len(states), 32) - ord("0")).astype(np.int8)
+
+
+def _term_tables():
+    # term -> piece code x square -> contribution of that piece standing on that square
+    tables = {term: np.zeros((5, 32), dtype=np.int32) for term in TERMS}
+    for square in range(32):
+        row = square // 4
+        tables["material"][1, square] = MAN_VALUE
+        tables["material"][3, square] = -MAN_VALUE
+        tables["kings"][2, square] = KING_VALUE
+        tables["kings"][4, square] = -KING_VALUE
+        tables["advancement"][1, square] = ADVANCEMENT_VALUE * row
+        tables["advancement"][3, square] = -ADVANCEMENT_VALUE * (7 - row)
+        if square in CENTRE_SQUARES:
+            tables["centre"][[1, 2], square] = CENTRE_VALUE
+            tables["centre"][[3, 4], square] = -CENTRE_VALUE
+        if square in WHITE_BACK_RANK:
+            tables["back_rank"][1, square] = BACK_RANK_VALUE
+        if square in BLACK_BACK_RANK:
+            tables["back_rank"][3, square] = -BACK_RANK_VALUE
+    return tables
+
+
+TERM_TABLES = _term_tables()
+SCORE_TABLE = sum(TERM_TABLES.values())
+SQUARES = np.arange(32)
+
+
+def evaluation_terms(boards):
+    return {term: table[boards, SQUARES].sum(axis=1) for term, table in TERM_TABLES.items()}
+
+
+def evaluate_boards(boards):
+    # A single gather of every piece's contribution, summed per board
+    return SCORE_TABLE[boards, SQUARES].sum(axis=1)
+
+
+def evaluate_board_reference(board):
+    # Scalar version of evaluate_boards, one piece at a time
+    score = 0
+    for square, piece in enumerate(board):
+        piece = int(piece)
+        if piece == 0:
+            continue
+        white = piece in (1, 2)
+        sign = 1 if white else -1
+        king = piece in (2, 4)
+        row = square // 4
+        score += sign * (KING_VALUE if king else MAN_VALUE)
+        if not king:
+            score += sign * ADVANCEMENT_VALUE * (row if white else 7 - row)
+            if square in (WHITE_BACK_RANK if white else BLACK_BACK_RANK):
+                score += sign * BACK_RANK_VALUE
+        if square in CENTRE_SQUARES:
+            score += sign * CENTRE_VALUE
+    return score
@@ -0,0 +1,55 @@
+import argparse
+import gc
+import time
+import tracemalloc
+
+from ..ValidateMove.util.bitboard import Position, find_legal_moves, find_packed_legal_moves
+
+POSITIONS = [
+    ("111111111111000000003333333333330", "black"),
+    ("111111111111000003003303333333331", "white"),
+    ("111111111110000100303303333333330", "black"),
+    ("400111111001001003003303000333330", "black"),
+    ("110111010001033103000330203300331", "white"),
+    ("000000200000400000000002000040000", "black")
+]
+
+
+def measure(generate, positions, iterations):
+    gc.collect()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for position, color in positions:
+            generate(position, color)
+    elapsed = time.perf_counter() - start
+
+    # Generated moves are kept alive while tracing so they are counted
+    tracemalloc.start()
+    generated = [generate(position, color) for position, color in positions]
+    snapshot = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    statistics = snapshot.statistics("filename")
+    del generated
+
+    return {
+        "generationsPerSecond": iterations * len(positions) / elapsed,
+        "allocationsPerPass": sum(stat.count for stat in statistics),
+        "bytesPerPass": sum(stat.size for stat in statistics)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare Move dataclasses with packed int moves")
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+
+    positions = [(Position.from_state(state), color) for state, color in POSITIONS]
+    for name, generate in (("Move dataclass", find_legal_moves), ("packed int", find_packed_legal_moves)):
+        result = measure(generate, positions, args.iterations)
+        print(f"{name:15} {result['generationsPerSecond']:12.0f} generations/s  "
+              f"{result['allocationsPerPass']:6} allocations  "
+              f"{result['bytesPerPass']:8} bytes per pass")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+import argparse
+import multiprocessing
+import time
+
+from ..Analysis.parallel_search import ParallelSearcher
+from ..ValidateMove.util.search import Searcher
+from .perft import REFERENCE_POSITIONS
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Root-split parallel search speedup against core count")
+    parser.add_argument("--depth", type=int, default=9)
+    parser.add_argument("--table-bits", type=int, default=18)
+    parser.add_argument("--workers", type=int, action="append",
+                        help="worker counts to compare, powers of two up to the core count by default")
+    args = parser.parse_args()
+
+    worker_counts = args.workers
+    if not worker_counts:
+        worker_counts = [1]
+        while worker_counts[-1] * 2 <= multiprocessing.cpu_count():
+            worker_counts.append(worker_counts[-1] * 2)
+    states = [position["state"] for position in REFERENCE_POSITIONS.values()]
+
+    start = time.perf_counter()
+    expected = [Searcher(table_bits=args.table_bits, exact_depth=True).search(state, args.depth) for state in states]
+    serial_time = time.perf_counter() - start
+    print(f"serial      {serial_time:8.3f}s")
+
+    for workers in worker_counts:
+        with ParallelSearcher(workers, args.table_bits) as searcher:
+            start = time.perf_counter()
+            results = [searcher.search(state, args.depth) for state in states]
+            elapsed = time.perf_counter() - start
+        matches = sum(result.score == reference.score for result, reference in zip(results, expected))
+        nodes = sum(result.nodes for result in results)
+        print(f"{workers:2} workers {elapsed:8.3f}s, speedup {serial_time / elapsed:5.2f}x, "
+              f"{nodes} nodes, {matches}/{len(states)} scores match serial")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+import argparse
+import sys
+import time
+
+from ..ValidateMove.util import bitboard
+from ..ValidateMove.util.bitboard import START_STATE, color_to_move
+from ..ValidateMove.util.validate_move import MoveValidator
+
+# Known leaf counts per depth. "chain" counts a complete multi-jump as one move (the published English draughts
+# perft numbers), "hop" counts every makeMove request, so each jump of a multi-jump is its own ply.
+REFERENCE_POSITIONS = {
+    "start": {
+        "state": START_STATE,
+        "chain": [7, 49, 302, 1469, 7361, 36768, 179740, 845931],
+        "hop": [7, 49, 302, 1469, 7361, 36768, 179255, 838248]
+    },
+    "forced_capture": {
+        "state": "111111111110000100303303333333330",
+        "chain": [1, 6, 42, 236, 1450, 7913],
+        "hop": [1, 6, 42, 236, 1450, 7913]
+    },
+    "kings_and_continuation": {
+        "state": "0001101114010010030033030003333329",
+        "chain": [2, 11, 77, 357, 2512, 10782],
+        "hop": [2, 11, 77, 353, 2443, 10326]
+    },
+    "white_near_promotion": {
+        "state": "110111010001033103000330203300331",
+        "chain": [10, 58, 323, 1756, 9343, 48753],
+        "hop": [10, 58, 323, 1756, 9315, 47342]
+    }
+}
+
+
+def legacy_successors(state, color):
+    return MoveValidator(state, color).find_all_valid_new_states_by_scanning()
+
+
+def bitboard_successors(state, color):
+    return bitboard.find_successor_states(state, color)
+
+
+ENGINES = {
+    "legacy": legacy_successors,
+    "bitboard": bitboard_successors
+}
+
+
+def chain_successors(successors, state, color):
+    # Follows continuation states until the capturing piece stops, so a multi-jump is a single move
+    result = []
+    for new_state in successors(state, color):
+        if new_state[32:33] in bitboard.CONTINUATION_TURNS:
+            result.extend(chain_successors(successors, new_state, color))
+        else:
+            result.append(new_state)
+    return result
+
+
+def perft(state, depth, successors, mode="chain"):
+    if depth == 0:
+        return 1
+    color = color_to_move(state)
+    if mode == "chain":
+        new_states = chain_successors(successors, state, color)
+    else:
+        new_states = successors(state, color)
+    if depth == 1:
+        return len(new_states)
+    return sum(perft(new_state, depth - 1, successors, mode) for new_state in new_states)
+
+
+def run(engine, mode, depth, positions):
+    failures = 0
+    for name in positions:
+        reference = REFERENCE_POSITIONS[name]
+        known = reference[mode]
+        for current_depth in range(1, min(depth, len(known)) + 1):
+            start = time.perf_counter()
+            nodes = perft(reference["state"], current_depth, ENGINES[engine], mode)
+            elapsed = time.perf_counter() - start
+            expected = known[current_depth - 1]
+            status = "ok" if nodes == expected else f"MISMATCH expected {expected}"
+            if nodes != expected:
+                failures += 1
+            print(f"{engine:9} {mode:5} {name:22} depth {current_depth}  {nodes:9} nodes  "
+                  f"{elapsed:8.3f}s  {nodes / elapsed if elapsed else 0:11.0f} nodes/s  {status}")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Count perft leaf nodes for the move generators")
+    parser.add_argument("--depth", type=int, default=5)
+    parser.add_argument("--engine", choices=sorted(ENGINES), action="append")
+    parser.add_argument("--mode", choices=("chain", "hop"), default="chain")
+    parser.add_argument("--position", choices=sorted(REFERENCE_POSITIONS), action="append")
+    args = parser.parse_args()
+
+    failures = 0
+    for engine in args.engine or ["legacy", "bitboard"]:
+        failures += run(engine, args.mode, args.depth, args.position or list(REFERENCE_POSITIONS))
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
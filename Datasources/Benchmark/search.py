@@ -0,0 +1,39 @@
+import argparse
+import time
+
+from ..ValidateMove.util.evaluation import material_evaluation, positional_evaluation
+from ..ValidateMove.util.search import Searcher
+from .perft import REFERENCE_POSITIONS
+
+EVALUATIONS = {
+    "material": material_evaluation,
+    "positional": positional_evaluation
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Alpha-beta search nodes per second on the perft reference positions")
+    parser.add_argument("--depth", type=int, default=8)
+    parser.add_argument("--table-bits", type=int, default=18)
+    parser.add_argument("--evaluation", choices=EVALUATIONS, default="positional")
+    parser.add_argument("--position", choices=REFERENCE_POSITIONS, action="append")
+    args = parser.parse_args()
+
+    total_nodes = 0
+    total_time = 0.0
+    for name in args.position or REFERENCE_POSITIONS:
+        searcher = Searcher(EVALUATIONS[args.evaluation], args.table_bits)
+        start = time.perf_counter()
+        result = searcher.search(REFERENCE_POSITIONS[name]["state"], args.depth)
+        elapsed = time.perf_counter() - start
+        total_nodes += result.nodes
+        total_time += elapsed
+        hit_rate = searcher.table.hits / searcher.table.probes if searcher.table.probes else 0.0
+        print(f"{name:24} depth {args.depth}: {result.nodes:9} nodes in {elapsed:7.3f}s, "
+              f"{result.nodes / elapsed:8.0f} nps, table hits {hit_rate:6.1%}, score {result.score:6}, "
+              f"best {result.state}")
+    print(f"{'total':24} {total_nodes:18} nodes in {total_time:7.3f}s, {total_nodes / total_time:8.0f} nps")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+import argparse
+import time
+
+from ..Analysis.self_play import self_play_games
+from ..Analysis.vector_evaluation import boards_from_states, evaluate_board_reference, evaluate_boards
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Vectorised board evaluation against the scalar reference")
+    parser.add_argument("--games", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    states = [state for game in self_play_games(args.games, args.seed) for state in game]
+
+    start = time.perf_counter()
+    expected = [evaluate_board_reference(state[:32]) for state in states]
+    scalar_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    boards = boards_from_states(states)
+    decode_time = time.perf_counter() - start
+    start = time.perf_counter()
+    scores = evaluate_boards(boards)
+    vector_time = time.perf_counter() - start
+
+    mismatches = int((scores != expected).sum())
+    print(f"{len(states)} boards, {mismatches} mismatches")
+    print(f"scalar reference: {len(states) / scalar_time:12.0f} boards/s")
+    print(f"vectorised:       {len(states) / vector_time:12.0f} boards/s, {scalar_time / vector_time:.1f}x")
+    print(f"  with decoding:  {len(states) / (decode_time + vector_time):12.0f} boards/s, "
+          f"{scalar_time / (decode_time + vector_time):.1f}x")
+
+
+if __name__ == "__main__":
+    main()
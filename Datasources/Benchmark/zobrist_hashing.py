@@ -0,0 +1,41 @@
+import argparse
+import time
+
+from ..Analysis.self_play import self_play_games
+from ..ValidateMove.util.bitboard import Position, apply_move, color_to_move, find_packed_legal_moves
+from ..ValidateMove.util.zobrist import hash_position, hash_state, update_hash
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Zobrist hash throughput and collisions over a self-play corpus")
+    parser.add_argument("--games", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    states = set()
+    for game_states in self_play_games(args.games, args.seed):
+        states.update(game_states)
+
+    start = time.perf_counter()
+    hashes = {hash_state(state) for state in states}
+    elapsed = time.perf_counter() - start
+    print(f"{len(states)} distinct states, {len(hashes)} distinct hashes, {len(states) - len(hashes)} collisions")
+    print(f"hash_state:  {len(states) / elapsed:10.0f} states/s")
+
+    updates = 0
+    update_time = 0.0
+    for state in states:
+        position = Position.from_state(state)
+        color = color_to_move(state)
+        key = hash_position(position)
+        successors = [(move, apply_move(position, move, color)) for move in find_packed_legal_moves(position, color)]
+        start = time.perf_counter()
+        for move, new_position in successors:
+            update_hash(key, position, move, new_position)
+        update_time += time.perf_counter() - start
+        updates += len(successors)
+    print(f"update_hash: {updates / update_time:10.0f} successors/s")
+
+
+if __name__ == "__main__":
+    main()
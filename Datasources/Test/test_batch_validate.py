@@ -0,0 +1,38 @@
+import unittest
+
+from parameterized import parameterized
+
+from ..Analysis.batch_validate import CAPTURE_REQUIRED, ILLEGAL_MOVE, MALFORMED_STATE, NOT_A_SINGLE_MOVE, \
+    NOT_PLAYERS_TURN, VALID, WRONG_RESULTING_STATE, validate_batch
+from ..Analysis.self_play import self_play_transitions
+from ..ValidateMove.util.validate_move import MoveValidator
+
+
+class TestBatchValidate(unittest.TestCase):
+    def test_matches_move_validator_on_self_play(self):
+        transitions = list(self_play_transitions(20, seed=7, invalid_per_move=3))
+        old_states, new_states, colors = zip(*transitions)
+        valid, _ = validate_batch(old_states, new_states, colors)
+        expected = [MoveValidator(old_state, color).validate_new_state(new_state)
+                    for old_state, new_state, color in transitions]
+        self.assertEqual(valid.tolist(), expected)
+
+    @parameterized.expand([
+        ["111111111111000000003333333333330", "111111111111000003003303333333331", "black", VALID],
+        ["0001101114010010030033030003333329", "004110011001001003003303000333331", "black", VALID],
+        ["400111111001001003003303000333330", "0001101114010010030033030003333329", "black", VALID],
+        ["111111111111000000003333333333330", "111111111111003000003303333333331", "white", NOT_PLAYERS_TURN],
+        ["111111111111000000003333333333330", "111111111111000033003303333333331", "black", NOT_A_SINGLE_MOVE],
+        ["111111111110000100303303333333330", "111111111110000130303003333333331", "black", CAPTURE_REQUIRED],
+        ["111111111111000000003333333333330", "111111111111000300003033333333331", "black", ILLEGAL_MOVE],
+        ["000030000110000000003333333333330", "300000000110000000003333333333331", "black", WRONG_RESULTING_STATE],
+        ["111111111111000000003333333333330", "111111111111000003003303333333330", "black", WRONG_RESULTING_STATE],
+        ["111111111111000000003333333333330", "11111111111100000300330333333333x", "black", WRONG_RESULTING_STATE],
+        ["111111111111000000003333333333330", "1111111111110000030033033333333", "black", MALFORMED_STATE],
+        ["111111111111000000003333333333330", "111111111111000003x03303333333331", "black", MALFORMED_STATE],
+        ["11111111111100000000333333333333", "111111111111000003003303333333331", "black", MALFORMED_STATE]
+    ])
+    def test_reason_codes(self, old_game_state, new_game_state, color, expected_reason):
+        valid, reasons = validate_batch([old_game_state], [new_game_state], [color])
+        self.assertEqual(reasons[0], expected_reason)
+        self.assertEqual(valid[0], expected_reason == VALID)
@@ -0,0 +1,123 @@
+import unittest
+
+from parameterized import parameterized
+
+from ..ValidateMove.util.bitboard import DIRECTIONS, JUMPS, NEIGHBOURS, Position, apply_move, decode_move, \
+    find_capture_chain_states, find_capture_chains, find_legal_moves, find_packed_legal_moves, find_successor_states, \
+    has_any_legal_move, is_valid_transition
+from ..ValidateMove.util.move import Move, pack_move
+from ..ValidateMove.util.validate_move import MoveValidator
+
+POSITIONS = [
+    ["111111111111000000003333333333330", "black"],
+    ["111111111111000003003303333333331", "white"],
+    ["111111111110000100303303333333330", "black"],
+    ["400111111001001003003303000333330", "black"],
+    ["0001101114010010030033030003333329", "black"],
+    ["110111010001033103000330203300331", "white"],
+    ["011111011311000000003303003333330", "black"],
+    ["111111110111010003003303333333330", "black"]
+]
+
+
+class TestBitboard(unittest.TestCase):
+    def test_neighbour_table_matches_get_index_of_neighbour(self):
+        validator = MoveValidator(old_game_state="111111111111000000003333333333330",
+                                  move_requester_color="black")
+        for square in range(32):
+            for direction in DIRECTIONS:
+                self.assertEqual(NEIGHBOURS[direction][square],
+                                 validator.get_index_of_neighbour(square, direction),
+                                 (square, direction))
+
+    def test_jump_table_matches_get_index_of_neighbour(self):
+        validator = MoveValidator(old_game_state="111111111111000000003333333333330",
+                                  move_requester_color="black")
+        for square in range(32):
+            for direction in DIRECTIONS:
+                captured = validator.get_index_of_neighbour(square, direction)
+                landing = None if captured is None else validator.get_index_of_neighbour(captured, direction)
+                expected = None if landing is None else (captured, landing)
+                self.assertEqual(JUMPS[direction][square], expected, (square, direction))
+
+    @parameterized.expand(POSITIONS)
+    def test_state_round_trip(self, state, color):
+        self.assertEqual(Position.from_state(state).to_state(), state)
+
+    def test_start_position(self):
+        position = Position.from_state("111111111111000000003333333333330")
+        self.assertEqual(position.white, 0x00000FFF)
+        self.assertEqual(position.black, 0xFFF00000)
+        self.assertEqual(position.kings, 0)
+        self.assertIsNone(position.continuation_square)
+
+    def test_invalid_board(self):
+        with self.assertRaises(ValueError):
+            Position.from_state("1111111111110000000a3333333333330")
+
+    @parameterized.expand(POSITIONS)
+    def test_successor_states_match_scanning(self, state, color):
+        expected = MoveValidator(state, color).find_all_valid_new_states_by_scanning()
+        self.assertEqual(find_successor_states(state, color), expected)
+
+    def test_continuation_only_allows_continuing_piece(self):
+        position = Position.from_state("0001101114010010030033030003333329")
+        self.assertEqual(find_legal_moves(position, "black"), [
+            Move(piece_start_location=9, piece_end_location=2, piece_type=4, capture_location=6),
+            Move(piece_start_location=9, piece_end_location=18, piece_type=4, capture_location=14)
+        ])
+
+    @parameterized.expand([
+        ["111111111111000000003333333333330", "111111111111000003003303333333331", pack_move(22, 17, 3)],
+        ["111111111110000100303303333333330", "111111111113000000003303333333331", pack_move(18, 11, 3, 15)],
+        ["000030000110000000003333333333330", "400000000110000000003333333333331", pack_move(4, 0, 3)],
+        ["111111111111000000003333333333330", "111111111111000000003333333333331", None],
+        ["111111111111000000003333333333330", "111111111111000033003303333333331", None],
+        ["111111111111000000003333333333330", "111111111111000003003304333333331", None]
+    ])
+    def test_decode_move(self, old_game_state, new_game_state, expected_move):
+        self.assertEqual(decode_move(Position.from_state(old_game_state), Position.from_state(new_game_state)),
+                         expected_move)
+
+    @parameterized.expand([
+        ["1111111111110000030033033333333311"],
+        ["111111111111000003003303333333332"],
+        ["11111111111100000300330333333333"],
+        ["111111111111000003x03303333333331"],
+        ["111111111111000003003303333333332x"],
+        [""]
+    ])
+    def test_malformed_transition_rejected(self, new_game_state):
+        self.assertFalse(is_valid_transition("111111111111000000003333333333330", new_game_state, "black"))
+
+    @parameterized.expand(POSITIONS + [
+        ["000000000000000000000000000031110", "black"],
+        ["000000000000000000000000000031110", "white"],
+        ["100000000000000000000000000000000", "white"],
+        ["300000000000000000000000000000000", "black"],
+        ["000000000000000000000000000000000", "black"]
+    ])
+    def test_has_any_legal_move_matches_successor_states(self, state, color):
+        self.assertEqual(has_any_legal_move(state, color), bool(find_successor_states(state, color)))
+
+    @parameterized.expand(POSITIONS)
+    def test_apply_move_matches_successor_states(self, state, color):
+        position = Position.from_state(state)
+        applied = [apply_move(position, move, color).to_state() for move in find_packed_legal_moves(position, color)]
+        self.assertEqual(applied, find_successor_states(state, color))
+
+    def test_double_jump_chain(self):
+        position = Position.from_state("100000000000010000000100030000000")
+        self.assertEqual(find_capture_chains(position, "black"), [(pack_move(25, 16, 3, 21), pack_move(16, 9, 3, 13))])
+        self.assertEqual(find_capture_chain_states("100000000000010000000100030000000", "black"), [
+            ("10000000000001003000000000000000216", "100000000300000000000000000000001")
+        ])
+
+    def test_branching_chains(self):
+        chains = find_capture_chain_states("0001101114010010030033030003333329", "black")
+        self.assertEqual(len(chains), 2)
+        for chain in chains:
+            self.assertNotIn(chain[-1][32], ("2", "3"))
+
+    def test_no_chains_without_captures(self):
+        self.assertEqual(find_capture_chain_states("111111111111000000003333333333330", "black"), [])
@@ -0,0 +1,48 @@
+import unittest
+
+from parameterized import parameterized
+
+from ..Analysis.self_play import self_play_games
+from ..ValidateMove.util.codec import POSITION_SIZE, decode_state, encode_state, pack_position
+from ..ValidateMove.util.bitboard import Position
+
+
+class TestCodec(unittest.TestCase):
+    @parameterized.expand([
+        ["111111111111000000003333333333330"],
+        ["200000000000010000000100040000001"],
+        ["10000000000001003000000000000000216"],
+        ["0000000000000000000000000000040039"],
+        ["000000000000000000000000000000000"],
+        ["4242424242424242424242420000000039"]
+    ])
+    def test_round_trip(self, state):
+        self.assertEqual(len(pack_position(Position.from_state(state))), POSITION_SIZE)
+        self.assertEqual(decode_state(encode_state(state)), state)
+
+    def test_start_state_matches_create_game_resolver(self):
+        self.assertEqual(encode_state("111111111111000000003333333333330"), "/w8AAAAA8P8AAAAA")
+
+    def test_round_trip_self_play(self):
+        for game in self_play_games(20, seed=14):
+            for state in game:
+                self.assertEqual(decode_state(encode_state(state)), state)
+
+    @parameterized.expand([
+        ["1111111111111111111111111000000000"],
+        ["111111111111000000003333333333335"],
+        ["11111111111100000000333333333333240"]
+    ])
+    def test_encode_invalid_state(self, state):
+        self.assertRaises(ValueError, encode_state, state)
+
+    @parameterized.expand([
+        ["/w8AAAAA8P8AAAA"],
+        ["/w8AAAAA8P8AAAAA/w8A"],
+        ["/w8AAP8AAAAAAAAA"],
+        ["/w8AAAAA8P8AAAAC"],
+        ["/w8AAAAA8P8AAACA"],
+        ["not base64!!"]
+    ])
+    def test_decode_invalid_state(self, encoded_state):
+        self.assertRaises(ValueError, decode_state, encoded_state)
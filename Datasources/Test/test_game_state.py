@@ -0,0 +1,57 @@
+import unittest
+
+from parameterized import parameterized
+
+from ..Analysis.self_play import self_play_games
+from ..ValidateMove.util.game_state import GameState
+
+
+class TestGameState(unittest.TestCase):
+    @parameterized.expand([
+        ["111111111111000000003333333333330", "0", "black", None],
+        ["111111111111000003003303333333331", "1", "white", None],
+        ["10000000000001003000000000000000216", "2", "black", 16],
+        ["0000000002000000000000000000000039", "3", "white", 9]
+    ])
+    def test_parse(self, state, turn, color_to_move, continuation_square):
+        game_state = GameState.parse(state)
+        self.assertEqual(game_state.state, state)
+        self.assertEqual(game_state.turn, turn)
+        self.assertEqual(game_state.color_to_move, color_to_move)
+        self.assertEqual(game_state.continuation_square, continuation_square)
+        self.assertEqual(game_state.position.to_state(), state)
+
+    def test_parse_self_play(self):
+        for game in self_play_games(20, seed=16):
+            for state in game:
+                self.assertEqual(GameState.parse(state).state, state)
+
+    @parameterized.expand([
+        [None],
+        [""],
+        ["11111111111100000000333333333333"],
+        ["111111111111000000003333333333330000"],
+        ["111111111111000000003333333333350"],
+        ["11111111111100000000333333333333a"],
+        ["111111111111000000003333333333334"],
+        ["1111111111110000000033333333333301"],
+        ["11111111111100000000333333333333 "],
+        ["10000000000001003000000000000000 2"],
+        ["1000000000000100300000000000000002"],
+        ["100000000000010030000000000000002x"],
+        ["100000000000010030000000000000002016"],
+        ["1000000000000100300000000000000002 16"],
+        ["10000000000001003000000000000000240"],
+        ["10000000000001003000000000000000232"],
+        ["1000000000000100300000000000000002²"],
+        ["10000000000001003000000000000000212"],
+        ["10000000000001003000000000000000210"],
+        ["111111111111100000003333333333330"],
+        ["111111111111000000033333333333330"]
+    ])
+    def test_parse_invalid(self, state):
+        self.assertRaises(ValueError, GameState.parse, state)
+
+    def test_position_is_cached(self):
+        game_state = GameState.parse("111111111111000000003333333333330")
+        self.assertIs(game_state.position, game_state.position)
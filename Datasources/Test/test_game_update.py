@@ -0,0 +1,202 @@
+import unittest
+
+from ..ValidateMove.util.bitboard import START_STATE
+from ..ValidateMove.util.codec import encode_state
+from ..ValidateMove.util.game_update import build_update_arguments, from_dynamodb_item, load_current_state, plan_move
+from ..ValidateMove.util.progress import NO_PROGRESS_LIMIT
+from ..ValidateMove.util.reply_digest import build_reply_digest
+from ..ValidateMove.util.repetition import REPETITION_LIMIT, position_key
+from ..ValidateMove.util.successor_cache import SUCCESSOR_CACHE
+
+BLACK_MOVE_STATE = "111111111111000003003303333333331"
+KINGS_STATE = "200000000000000000000000000000041"
+KING_MOVE_STATE = "000002000000000000000000000000040"
+MATERIAL_VALUES = {
+    ':whitePiecesValue': {"N": "12"},
+    ':whiteKingsValue': {"N": "0"},
+    ':blackPiecesValue': {"N": "12"},
+    ':blackKingsValue': {"N": "0"}
+}
+MATERIAL_ACTIONS = "whitePieces=:whitePiecesValue, whiteKings=:whiteKingsValue, blackPieces=:blackPiecesValue, " \
+                   "blackKings=:blackKingsValue"
+
+
+def game_item(state, **attributes):
+    item = {
+        "gameId": {"S": "game"},
+        "currentGameState": {"S": state},
+        "whitePlayer": {"S": "white-player"},
+        "blackPlayer": {"S": "black-player"}
+    }
+    item.update(attributes)
+    return item
+
+
+def kings_item(position_count, no_progress_count):
+    return game_item(KINGS_STATE,
+                     positionCounts={"M": {position_key(KING_MOVE_STATE): {"N": str(position_count)}}},
+                     noProgressCount={"N": str(no_progress_count)})
+
+
+class TestPlanMove(unittest.TestCase):
+    def setUp(self):
+        SUCCESSOR_CACHE.clear()
+
+    def test_load_current_state(self):
+        game_state, compact = load_current_state(game_item(START_STATE))
+        self.assertEqual((game_state.state, game_state.color_to_move, compact), (START_STATE, "black", False))
+        item = game_item(encode_state(BLACK_MOVE_STATE), stateEncoding={"S": "COMPACT"})
+        game_state, compact = load_current_state(item)
+        self.assertEqual((game_state.state, game_state.color_to_move, compact), (BLACK_MOVE_STATE, "white", True))
+        self.assertRaises(ValueError, load_current_state, game_item(START_STATE[:32]))
+
+    def test_valid_move(self):
+        update = plan_move(game_item(START_STATE), "black-player", BLACK_MOVE_STATE)
+        self.assertEqual(update.new_game_states, [BLACK_MOVE_STATE])
+        self.assertTrue(update.progress)
+        self.assertIsNone(update.game_result)
+
+    def test_finished_game(self):
+        item = kings_item(REPETITION_LIMIT, 0)
+        item["gameResult"] = {"S": "TIE"}
+        self.assertIsNone(plan_move(item, "white-player", KING_MOVE_STATE))
+
+    def test_not_players_turn(self):
+        self.assertIsNone(plan_move(game_item(START_STATE), "white-player", BLACK_MOVE_STATE))
+
+    def test_illegal_move(self):
+        self.assertIsNone(plan_move(game_item(START_STATE), "black-player", "111111111111000003003333033333331"))
+
+    def test_malformed_state(self):
+        self.assertIsNone(plan_move(game_item(START_STATE), "black-player", "11111111111100000300330333333333"))
+
+    def test_threefold_repetition(self):
+        update = plan_move(kings_item(REPETITION_LIMIT - 1, 0), "white-player", KING_MOVE_STATE)
+        self.assertEqual(update.position_count, REPETITION_LIMIT)
+        self.assertFalse(update.reset_position_counts)
+        self.assertEqual((update.game_result, update.game_result_reason), ("TIE", "TIE_BY_REPETITION"))
+
+    def test_repetition_below_limit(self):
+        update = plan_move(kings_item(REPETITION_LIMIT - 2, 0), "white-player", KING_MOVE_STATE)
+        self.assertEqual(update.position_count, REPETITION_LIMIT - 1)
+        self.assertIsNone(update.game_result)
+
+    def test_progress_resets_repetition_counts(self):
+        item = game_item(START_STATE, positionCounts={"M": {position_key(BLACK_MOVE_STATE): {"N": "2"}}})
+        update = plan_move(item, "black-player", BLACK_MOVE_STATE)
+        self.assertTrue(update.reset_position_counts)
+        self.assertEqual(update.position_count, 1)
+
+    def test_no_progress_limit(self):
+        update = plan_move(kings_item(0, NO_PROGRESS_LIMIT - 1), "white-player", KING_MOVE_STATE)
+        self.assertFalse(update.progress)
+        self.assertEqual((update.game_result, update.game_result_reason),
+                         ("TIE", "TIE_BY_NO_CAPTURE_OR_PIECE_MOVEMENT"))
+
+    def test_no_progress_below_limit(self):
+        update = plan_move(kings_item(0, NO_PROGRESS_LIMIT - 2), "white-player", KING_MOVE_STATE)
+        self.assertIsNone(update.game_result)
+
+    def test_capturing_last_piece(self):
+        update = plan_move(game_item("200004000000000000000000000000001"), "white-player",
+                           "000000000200000000000000000000000")
+        self.assertEqual((update.game_result, update.game_result_reason), ("WHITE_WIN", "BLACK_HAS_NO_PIECES"))
+        self.assertIsNone(update.reply_digest)
+        self.assertEqual(update.material.black_pieces, 0)
+
+    def test_current_digest_decides(self):
+        # A digest that leaves out a legal move turns it away while it belongs to the position
+        digest = build_reply_digest(["111111111111000000303333333333331"])
+        item = game_item(START_STATE, replyDigest={"B": digest}, replyDigestKey={"S": position_key(START_STATE)})
+        self.assertIsNone(plan_move(item, "black-player", BLACK_MOVE_STATE))
+
+    def test_stale_digest_falls_back_to_validation(self):
+        digest = build_reply_digest(["111111111111000000303333333333331"])
+        item = game_item(START_STATE, replyDigest={"B": digest}, replyDigestKey={"S": "0000000000000000"})
+        self.assertIsNotNone(plan_move(item, "black-player", BLACK_MOVE_STATE))
+
+
+class TestBuildUpdateArguments(unittest.TestCase):
+    def setUp(self):
+        SUCCESSOR_CACHE.clear()
+
+    def assert_arguments(self, arguments, expression, values, names=None):
+        values = dict(values, **MATERIAL_VALUES)
+        values[':replyDigestValue'] = arguments["ExpressionAttributeValues"][':replyDigestValue']
+        self.assertEqual(arguments["UpdateExpression"], expression)
+        self.assertEqual(arguments["ExpressionAttributeValues"], values)
+        self.assertEqual(arguments.get("ExpressionAttributeNames"), names)
+
+    def test_legacy_item(self):
+        update = plan_move(game_item(START_STATE), "black-player", BLACK_MOVE_STATE)
+        key = position_key(BLACK_MOVE_STATE)
+        self.assert_arguments(
+            build_update_arguments(update),
+            "ADD gameStateHistory :gameStateAddValue  SET currentGameState=:gameStateValue, "
+            "positionCounts=:positionCountsValue, noProgressCount=:noProgressCountValue, " + MATERIAL_ACTIONS
+            + ", replyDigest=:replyDigestValue, replyDigestKey=:replyDigestKeyValue",
+            {
+                ':gameStateValue': {"S": BLACK_MOVE_STATE},
+                ':gameStateAddValue': {"SS": [BLACK_MOVE_STATE]},
+                ':positionCountsValue': {"M": {key: {"N": "1"}}},
+                ':noProgressCountValue': {"N": "0"},
+                ':replyDigestKeyValue': {"S": key}
+            })
+
+    def test_move_history_item(self):
+        update = plan_move(game_item(START_STATE, moveHistory={"L": []}), "black-player", BLACK_MOVE_STATE)
+        key = position_key(BLACK_MOVE_STATE)
+        self.assert_arguments(
+            build_update_arguments(update),
+            "SET currentGameState=:gameStateValue, moveHistory=list_append(moveHistory, :moveHistoryValue), "
+            "positionCounts=:positionCountsValue, noProgressCount=:noProgressCountValue, " + MATERIAL_ACTIONS
+            + ", replyDigest=:replyDigestValue, replyDigestKey=:replyDigestKeyValue",
+            {
+                ':gameStateValue': {"S": BLACK_MOVE_STATE},
+                ':moveHistoryValue': {"L": [{"N": str(22 | 17 << 5)}]},
+                ':positionCountsValue': {"M": {key: {"N": "1"}}},
+                ':noProgressCountValue': {"N": "0"},
+                ':replyDigestKeyValue': {"S": key}
+            })
+
+    def test_compact_item(self):
+        item = game_item(encode_state(START_STATE), stateEncoding={"S": "COMPACT"})
+        update = plan_move(item, "black-player", encode_state(BLACK_MOVE_STATE))
+        key = position_key(BLACK_MOVE_STATE)
+        self.assert_arguments(
+            build_update_arguments(update),
+            "ADD gameStateHistory :gameStateAddValue  SET currentGameState=:gameStateValue, "
+            "positionCounts=:positionCountsValue, noProgressCount=:noProgressCountValue, " + MATERIAL_ACTIONS
+            + ", replyDigest=:replyDigestValue, replyDigestKey=:replyDigestKeyValue",
+            {
+                ':gameStateValue': {"S": "/w8AAAAAsv8AAAAB"},
+                ':gameStateAddValue': {"SS": ["/w8AAAAAsv8AAAAB"]},
+                ':positionCountsValue': {"M": {key: {"N": "1"}}},
+                ':noProgressCountValue': {"N": "0"},
+                ':replyDigestKeyValue': {"S": key}
+            })
+
+    def test_counts_and_result(self):
+        update = plan_move(kings_item(REPETITION_LIMIT - 1, 5), "white-player", KING_MOVE_STATE)
+        arguments = build_update_arguments(update)
+        self.assertEqual(arguments["UpdateExpression"],
+                         "ADD gameStateHistory :gameStateAddValue, noProgressCount :noProgressIncrementValue  "
+                         "SET currentGameState=:gameStateValue, positionCounts.#positionKey=:positionCountValue, "
+                         "whitePieces=:whitePiecesValue, whiteKings=:whiteKingsValue, blackPieces=:blackPiecesValue, "
+                         "blackKings=:blackKingsValue, replyDigest=:replyDigestValue, "
+                         "replyDigestKey=:replyDigestKeyValue, gameResult=:gameResultValue, "
+                         "gameResultReason=:gameResultReasonValue")
+        self.assertEqual(arguments["ExpressionAttributeNames"], {'#positionKey': position_key(KING_MOVE_STATE)})
+        values = arguments["ExpressionAttributeValues"]
+        self.assertEqual(values[':positionCountValue'], {"N": str(REPETITION_LIMIT)})
+        self.assertEqual(values[':noProgressIncrementValue'], {"N": "1"})
+        self.assertEqual(values[':gameResultValue'], {"S": "TIE"})
+        self.assertEqual(values[':gameResultReasonValue'], {"S": "TIE_BY_REPETITION"})
+
+    def test_from_dynamodb_item(self):
+        self.assertEqual(from_dynamodb_item({
+            "gameId": {"S": "game"},
+            "noProgressCount": {"N": "3"},
+            "moveHistory": {"L": [{"N": "566"}]},
+            "replyDigest": {"B": b"\x00\x01"}
+        }), {"gameId": "game", "noProgressCount": 3, "moveHistory": [566], "replyDigest": "AAE="})
@@ -0,0 +1,51 @@
+import unittest
+
+from parameterized import parameterized
+
+from ..Analysis.self_play import self_play_games
+from ..ValidateMove.util.codec import COMPACT_ENCODING, encode_state
+from ..ValidateMove.util.history import START_STATE, encode_hops, game_state_history, replay, state_at
+
+
+class TestHistory(unittest.TestCase):
+    @parameterized.expand([
+        ["111111111111000000003333333333330", ["111111111111000003003303333333331"], [22 | 17 << 5]],
+        ["100000000000010000000100030000000",
+         ["10000000000001003000000000000000216", "100000000300000000000000000000001"], [25 | 16 << 5, 16 | 9 << 5]]
+    ])
+    def test_encode_hops(self, old_game_state, new_game_states, expected_result):
+        self.assertEqual(encode_hops(old_game_state, new_game_states), expected_result)
+
+    def test_encode_hops_rejects_unrelated_states(self):
+        self.assertRaises(ValueError, encode_hops, START_STATE, ["100000000300000000000000000000001"])
+
+    def test_replay_self_play(self):
+        for game in self_play_games(20, seed=15):
+            hops = encode_hops(game[0], game[1:])
+            self.assertTrue(all(0 <= hop < 1 << 10 for hop in hops))
+            self.assertEqual(list(replay(hops)), game)
+
+    def test_replay_capture_chain(self):
+        states = list(replay([25 | 16 << 5, 16 | 9 << 5], start_state="100000000000010000000100030000000"))
+        self.assertEqual(states, ["100000000000010000000100030000000", "10000000000001003000000000000000216",
+                                  "100000000300000000000000000000001"])
+
+    def test_replay_illegal_hop(self):
+        self.assertRaises(ValueError, list, replay([0 | 4 << 5]))
+
+    def test_state_at(self):
+        game = next(self_play_games(1, seed=15))
+        hops = encode_hops(game[0], game[1:])
+        for ply in (0, 1, len(hops) // 2, len(hops)):
+            self.assertEqual(state_at(hops, ply), game[ply])
+        self.assertRaises(IndexError, state_at, hops, len(hops) + 1)
+
+    def test_game_state_history(self):
+        game = next(self_play_games(1, seed=15))
+        hops = encode_hops(game[0], game[1:])
+        self.assertEqual(game_state_history({"moveHistory": hops}), game)
+        self.assertEqual(game_state_history({"moveHistory": hops, "stateEncoding": COMPACT_ENCODING}),
+                         [encode_state(state) for state in game])
+        self.assertEqual(game_state_history({"moveHistory": []}), [START_STATE])
+        # Games stored before the move list return their set of states untouched
+        self.assertEqual(game_state_history({"gameStateHistory": game}), game)
@@ -0,0 +1,45 @@
+import unittest
+
+from parameterized import parameterized
+
+from ..ValidateMove.util.material import Material
+
+
+class TestMaterial(unittest.TestCase):
+    @parameterized.expand([
+        ["111111111111000000003333333333330", Material(12, 0, 12, 0)],
+        ["200000000000010000000100040000000", Material(3, 1, 1, 1)],
+        ["000000000000000000000000000000000", Material(0, 0, 0, 0)]
+    ])
+    def test_from_state(self, state, expected_result):
+        self.assertEqual(Material.from_state(state), expected_result)
+
+    def test_item_round_trip(self):
+        material = Material(11, 2, 9, 1)
+        self.assertEqual(Material.from_item(material.to_item()), material)
+
+    def test_from_item_without_counts(self):
+        self.assertIsNone(Material.from_item({"currentGameState": {"S": "111111111111000000003333333333330"}}))
+
+    @parameterized.expand([
+        ["111111111111000000003333333333330", ["111111111111000003003303333333331"], Material(12, 0, 12, 0)],
+        ["111111111110000100303303333333330", ["111111111113000000003303333333331"], Material(11, 0, 12, 0)],
+        ["100000000000010000000100030000000",
+         ["10000000000001003000000000000000216", "100000000300000000000000000000001"], Material(1, 0, 1, 0)],
+        ["000000000000020003000000000000000", ["000000003000000000000000000000001"], Material(0, 0, 1, 0)],
+        ["000000000000000000000000100000030", ["000000000000000000000000000020030"], Material(1, 1, 1, 0)],
+        ["000000030000000000000000000000000", ["000400000000000000000000000000001"], Material(0, 0, 1, 1)],
+        ["400000000000000000000000000000000", ["000040000000000000000000000000001"], Material(0, 0, 1, 1)]
+    ])
+    def test_apply_states(self, old_game_state, new_game_states, expected_result):
+        material = Material.from_state(old_game_state).apply_states(old_game_state, new_game_states)
+        self.assertEqual(material, expected_result)
+        self.assertEqual(material, Material.from_state(new_game_states[-1]))
+
+    @parameterized.expand([
+        [Material(12, 0, 12, 0), None],
+        [Material(0, 0, 3, 1), "white"],
+        [Material(2, 2, 0, 0), "black"]
+    ])
+    def test_color_without_pieces(self, material, expected_result):
+        self.assertEqual(material.color_without_pieces(), expected_result)
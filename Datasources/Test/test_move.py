@@ -0,0 +1,31 @@
+import unittest
+
+from parameterized import parameterized
+
+from ..ValidateMove.util.move import Move, move_capture, move_end, move_piece_type, move_start, pack_move, \
+    unpack_move
+
+
+class TestMove(unittest.TestCase):
+    def test_pack_round_trip(self):
+        for start in range(32):
+            for end in range(32):
+                for piece_type in range(1, 5):
+                    for capture_location in (None, 0, 17, 31):
+                        packed = pack_move(start, end, piece_type, capture_location)
+                        self.assertEqual(unpack_move(packed), (start, end, piece_type, capture_location))
+                        self.assertEqual(move_start(packed), start)
+                        self.assertEqual(move_end(packed), end)
+                        self.assertEqual(move_piece_type(packed), piece_type)
+                        self.assertEqual(move_capture(packed), capture_location)
+
+    @parameterized.expand([
+        [Move(piece_start_location=21, piece_end_location=17, piece_type=3)],
+        [Move(piece_start_location=18, piece_end_location=11, piece_type=3, capture_location=15)],
+        [Move(piece_start_location=0, piece_end_location=9, piece_type=2, capture_location=4)]
+    ])
+    def test_move_view(self, move):
+        self.assertEqual(Move.from_packed(move.pack()), move)
+
+    def test_capture_of_square_zero_is_a_capture(self):
+        self.assertNotEqual(pack_move(9, 18, 4, 0), pack_move(9, 18, 4))
@@ -0,0 +1,102 @@
+import json
+import os
+import struct
+import tempfile
+import unittest
+
+from ..Analysis.opening_book_builder import aggregate, games_from_export, games_from_self_play, write_book
+from ..ValidateMove.util.bitboard import START_STATE
+from ..ValidateMove.util.opening_book import ENTRY, HEADER, BookEntry, OpeningBook
+from ..ValidateMove.util.zobrist import hash_state
+
+
+class TestOpeningBook(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "book.bin")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def build(self, games, plies=6, min_games=1):
+        statistics = aggregate(games, plies)
+        write_book(self.path, statistics, plies, min_games)
+        return statistics
+
+    def test_start_position_counts_every_game(self):
+        games = list(games_from_self_play(40, seed=3))
+        self.build(games)
+        with OpeningBook(self.path) as book:
+            entry = book.probe(START_STATE)
+        self.assertEqual(entry.games, 40)
+        self.assertEqual(entry.white_wins + entry.black_wins + entry.ties, 40)
+        self.assertEqual(entry.white_wins, sum(result == "WHITE_WIN" for _, result in games))
+
+    def test_every_aggregated_position_is_found(self):
+        statistics = self.build(games_from_self_play(30, seed=5))
+        with OpeningBook(self.path) as book:
+            self.assertEqual(book.size, len(statistics))
+            for key, counts in statistics.items():
+                self.assertEqual(book.probe_key(key), BookEntry(*counts))
+
+    def test_entries_sorted(self):
+        self.build(games_from_self_play(30, seed=5))
+        with open(self.path, "rb") as book_file:
+            data = book_file.read()
+        keys = [ENTRY.unpack_from(data, offset)[0] for offset in range(HEADER.size, len(data), ENTRY.size)]
+        self.assertEqual(keys, sorted(keys))
+
+    def test_missing_positions(self):
+        self.build(games_from_self_play(5, seed=1), plies=2)
+        with OpeningBook(self.path) as book:
+            self.assertIsNone(book.probe("000000000000000000000000000000130"))
+            self.assertIsNone(book.probe_key(0))
+            self.assertIsNone(book.probe_key(2 ** 64 - 1))
+
+    def test_min_games(self):
+        self.build(games_from_self_play(20, seed=2), min_games=20)
+        with OpeningBook(self.path) as book:
+            self.assertEqual(book.size, 1)
+            self.assertEqual(book.probe(START_STATE).games, 20)
+
+    def test_positions_repeated_in_a_game_counted_once(self):
+        states = [START_STATE, "111111111111000000003333333333330"]
+        self.build([(states, "TIE")])
+        with OpeningBook(self.path) as book:
+            self.assertEqual(book.probe(START_STATE), BookEntry(1, 0, 0, 1))
+
+    def test_book_moves(self):
+        self.build(games_from_self_play(50, seed=4), plies=1)
+        with OpeningBook(self.path) as book:
+            moves = book.book_moves(START_STATE, "black")
+            self.assertTrue(moves)
+            self.assertEqual(sum(entry.games for _, entry in moves), 50)
+            self.assertEqual([entry.games for _, entry in moves],
+                             sorted((entry.games for _, entry in moves), reverse=True))
+            self.assertAlmostEqual(moves[0][1].score("black") + moves[0][1].score("white"), 1)
+
+    def test_games_from_export(self):
+        items = [
+            {"Item": {"moveHistory": {"L": [{"N": str(21 | 17 << 5)}, {"N": str(9 | 13 << 5)}]},
+                      "gameResult": {"S": "BLACK_WIN"}}},
+            {"Item": {"moveHistory": {"L": []}}},
+            {"Item": {"gameStateHistory": {"SS": [START_STATE]}, "gameResult": {"S": "TIE"}}}
+        ]
+        export_path = os.path.join(self.directory.name, "export.json")
+        with open(export_path, "w") as export_file:
+            export_file.write("\n".join(json.dumps(item) for item in items))
+        games = [(list(states), result) for states, result in games_from_export(export_path)]
+        self.assertEqual(len(games), 1)
+        self.assertEqual(len(games[0][0]), 3)
+        self.assertEqual(games[0][1], "BLACK_WIN")
+
+    def test_not_a_book(self):
+        with open(self.path, "wb") as book_file:
+            book_file.write(struct.pack("<4sB3xII", b"XXXX", 1, 0, 0))
+        with self.assertRaises(ValueError):
+            OpeningBook(self.path)
+
+    def test_key_is_zobrist_hash(self):
+        self.build([([START_STATE], "WHITE_WIN")])
+        with OpeningBook(self.path) as book:
+            self.assertEqual(book.probe_key(hash_state(START_STATE)), BookEntry(1, 1, 0, 0))
@@ -0,0 +1,39 @@
+import unittest
+
+from ..Analysis.parallel_search import ParallelSearcher
+from ..Analysis.self_play import self_play_games
+from ..Benchmark.perft import REFERENCE_POSITIONS
+from ..ValidateMove.util.search import Searcher
+
+
+class TestParallelSearch(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.searcher = ParallelSearcher(workers=2, table_bits=14)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.searcher.close()
+
+    def test_matches_serial_search(self):
+        for position in REFERENCE_POSITIONS.values():
+            for depth in (1, 4):
+                result = self.searcher.search(position["state"], depth)
+                expected = Searcher(table_bits=14, exact_depth=True).search(position["state"], depth)
+                self.assertEqual(result.score, expected.score)
+                self.assertEqual(result.depth, depth)
+
+    def test_deterministic(self):
+        state = REFERENCE_POSITIONS["white_near_promotion"]["state"]
+        first = self.searcher.search(state, 5)
+        for _ in range(3):
+            result = self.searcher.search(state, 5)
+            self.assertEqual((result.move, result.score), (first.move, first.score))
+
+    def test_no_legal_moves(self):
+        self.assertIsNone(self.searcher.search("000000000000000000000000000000031", 3))
+
+    def test_analyse_game(self):
+        game = next(self_play_games(1, seed=21, max_plies=12))
+        results = self.searcher.analyse_game(game, 2)
+        self.assertEqual(len(results), len(game))
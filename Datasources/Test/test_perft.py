@@ -0,0 +1,15 @@
+import unittest
+
+from parameterized import parameterized
+
+from ..Benchmark.perft import ENGINES, REFERENCE_POSITIONS, perft
+
+CASES = [[engine, name, mode] for engine in ENGINES for name in REFERENCE_POSITIONS for mode in ("chain", "hop")]
+
+
+class TestPerft(unittest.TestCase):
+    @parameterized.expand(CASES)
+    def test_reference_counts(self, engine, name, mode):
+        reference = REFERENCE_POSITIONS[name]
+        for depth in range(1, 4):
+            self.assertEqual(perft(reference["state"], depth, ENGINES[engine], mode), reference[mode][depth - 1])
@@ -0,0 +1,16 @@
+import unittest
+
+from parameterized import parameterized
+
+from ..ValidateMove.util.progress import is_progress_move
+
+
+class TestProgress(unittest.TestCase):
+    @parameterized.expand([
+        ["111111111111000000003333333333330", "111111111111000003003303333333331", True],
+        ["111111111110000100303303333333330", "111111111113000000003303333333331", True],
+        ["111111111111000004003303333333330", "111111111111000000003343333333331", False],
+        ["100000000000010000000100030000000", "100000000300000000000000000000001", True]
+    ])
+    def test_is_progress_move(self, old_game_state, new_game_state, expected_result):
+        self.assertEqual(is_progress_move(old_game_state, new_game_state), expected_result)
@@ -0,0 +1,14 @@
+import unittest
+
+from ..ValidateMove.util.repetition import position_key
+from ..ValidateMove.util.zobrist import hash_state
+
+
+class TestRepetition(unittest.TestCase):
+    def test_position_key_is_hex_zobrist_hash(self):
+        key = position_key("111111111111000000003333333333330")
+        self.assertEqual(len(key), 16)
+        self.assertEqual(int(key, 16), hash_state("111111111111000000003333333333330"))
+
+    def test_start_position_key_matches_create_game_resolver(self):
+        self.assertEqual(position_key("111111111111000000003333333333330"), "c36a289938adf692")
@@ -0,0 +1,27 @@
+import unittest
+
+from ..Analysis.self_play import self_play_games
+from ..ValidateMove.util.bitboard import color_to_move, find_successor_states
+from ..ValidateMove.util.reply_digest import DIGEST_SIZE, build_reply_digest, digest_contains
+
+
+class TestReplyDigest(unittest.TestCase):
+    def test_build_reply_digest(self):
+        states = find_successor_states("111111111111000000003333333333330", "black")
+        reply_digest = build_reply_digest(states)
+        self.assertEqual(len(reply_digest), len(states) * DIGEST_SIZE)
+        self.assertEqual(reply_digest, build_reply_digest(reversed(states)))
+
+    def test_empty_reply_digest(self):
+        self.assertEqual(build_reply_digest([]), b"")
+        self.assertFalse(digest_contains(b"", "111111111111000000003333333333330"))
+
+    def test_digest_contains_matches_successors(self):
+        for game in self_play_games(10, seed=18):
+            for state, next_state in zip(game, game[1:]):
+                successors = find_successor_states(state, color_to_move(state))
+                reply_digest = build_reply_digest(successors)
+                for successor in successors:
+                    self.assertTrue(digest_contains(reply_digest, successor))
+                self.assertFalse(digest_contains(reply_digest, state))
+                self.assertTrue(digest_contains(reply_digest, next_state))
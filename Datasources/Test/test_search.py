@@ -0,0 +1,145 @@
+import unittest
+
+from parameterized import parameterized
+
+from ..ValidateMove.util.bitboard import Position, find_successor_states
+from ..ValidateMove.util.evaluation import material_evaluation, positional_evaluation
+from ..ValidateMove.util.search import (DEADLINE_CHECK_INTERVAL, MAX_DEPTH, WIN_SCORE, WIN_THRESHOLD, Searcher,
+                                        choose_move)
+from ..ValidateMove.util.transposition_table import EXACT, LOWER_BOUND, TranspositionTable
+
+
+class StepClock:
+    # Stands in for time.perf_counter, moving on by a fixed step every time it is read
+    def __init__(self, step):
+        self.step = step
+        self.readings = 0
+
+    def __call__(self):
+        self.readings += 1
+        return self.readings * self.step
+
+
+class TestSearch(unittest.TestCase):
+    def test_takes_last_piece(self):
+        result = Searcher().search("000000000000020003000000000000000", 3)
+        self.assertEqual(result.state, "000000003000000000000000000000001")
+        self.assertEqual(result.score, WIN_SCORE - 1)
+
+    def test_blocks_last_piece(self):
+        # The reply is scored by quiescence, which has to see that black can't move rather than evaluate it
+        result = Searcher().search("000100000000120000003000000000001", 1)
+        self.assertEqual(result.state, "000100000000020010003000000000000")
+        self.assertEqual(result.score, WIN_SCORE - 1)
+
+    def test_follows_capture_chain(self):
+        searcher = Searcher()
+        result = searcher.search("100000000000010000000100030000000", 2)
+        self.assertEqual(result.state, "10000000000001003000000000000000216")
+        result = searcher.search(result.state, 2)
+        self.assertEqual(result.state, "100000000300000000000000000000001")
+
+    def test_no_legal_moves(self):
+        self.assertIsNone(Searcher().search("000000000000000000000000000000031", 4))
+
+    @parameterized.expand([
+        ["111111111111000000003333333333330", "black"],
+        ["111111111111000003003303333333331", "white"],
+        ["10000000000001003000000000000000216", "black"]
+    ])
+    def test_choose_move_is_legal(self, state, color):
+        self.assertIn(choose_move(state, color, depth=4), find_successor_states(state, color))
+
+    def test_choose_move_not_players_turn(self):
+        self.assertRaises(ValueError, choose_move, "111111111111000000003333333333330", "white")
+
+    def test_table_keeps_search_result(self):
+        searcher = Searcher(table_bits=10)
+        first = searcher.search("111111111111000000003333333333330", 4)
+        second = searcher.search("111111111111000000003333333333330", 4)
+        self.assertEqual(first.state, second.state)
+        self.assertEqual(first.score, second.score)
+        self.assertLess(second.nodes, first.nodes)
+
+    def test_canonical_table_matches_plain_table(self):
+        for state in ("111111111111000000003333333333330", "110111010001033103000330203300331"):
+            for depth in (1, 3, 5):
+                plain = Searcher(table_bits=12, exact_depth=True).search(state, depth)
+                canonical = Searcher(table_bits=12, exact_depth=True, canonical=True).search(state, depth)
+                self.assertEqual(canonical.score, plain.score)
+
+    def test_canonical_table_shares_mirrored_positions(self):
+        searcher = Searcher(table_bits=12, canonical=True)
+        first = searcher.search("111111111111000000003333333333330", 4)
+        mirrored = searcher.search("111111111111000000003333333333331", 4)
+        self.assertEqual(mirrored.score, first.score)
+        self.assertLess(mirrored.nodes, first.nodes)
+        self.assertIn(mirrored.state, find_successor_states("111111111111000000003333333333331", "white"))
+
+    def test_search_with_budget(self):
+        # Every clock reading moves a millisecond on, so a 100ms budget runs out after 100 deadline checks
+        clock = StepClock(0.001)
+        searcher = Searcher(clock=clock)
+        result = searcher.search_with_budget("110111010001033103000330203300331", 100)
+        self.assertEqual(result.nodes, searcher.nodes)
+        self.assertLessEqual(result.nodes, 101 * DEADLINE_CHECK_INTERVAL)
+        self.assertGreater(clock.readings, 100)
+        self.assertGreaterEqual(result.depth, 2)
+        self.assertLess(result.depth, MAX_DEPTH)
+        self.assertIn(result.state, find_successor_states("110111010001033103000330203300331", "white"))
+        self.assertEqual(result.principal_variation[0], result.move)
+        self.assertLessEqual(len(result.principal_variation), result.depth)
+
+    def test_search_with_budget_is_deterministic(self):
+        first = Searcher(clock=StepClock(0.001)).search_with_budget("110111010001033103000330203300331", 50)
+        second = Searcher(clock=StepClock(0.001)).search_with_budget("110111010001033103000330203300331", 50)
+        self.assertEqual((first.move, first.score, first.depth, first.nodes),
+                         (second.move, second.score, second.depth, second.nodes))
+
+    def test_search_with_budget_matches_fixed_depth(self):
+        result = Searcher(clock=StepClock(0)).search_with_budget("111111111111000000003333333333330", 1, max_depth=4)
+        self.assertEqual(result.depth, 4)
+        self.assertEqual(result.score, Searcher().search("111111111111000000003333333333330", 4).score)
+
+    def test_search_with_budget_single_move(self):
+        result = Searcher().search_with_budget("111111111110000100303303333333330", 1000)
+        self.assertEqual(result.state, "111111111113000000003303333333331")
+        self.assertEqual(result.depth, 0)
+
+    def test_search_with_budget_no_legal_moves(self):
+        self.assertIsNone(Searcher().search_with_budget("000000000000000000000000000000031", 100))
+
+    def test_search_with_budget_stops_at_win(self):
+        result = Searcher(clock=StepClock(0)).search_with_budget("100000000000000000000000000000040", 1)
+        self.assertGreater(result.score, WIN_THRESHOLD)
+        self.assertLess(result.depth, MAX_DEPTH)
+
+
+class TestTranspositionTable(unittest.TestCase):
+    def test_probe_and_store(self):
+        table = TranspositionTable(size_bits=4)
+        self.assertIsNone(table.probe(0x123))
+        table.store(0x123, 3, 50, EXACT, 7)
+        self.assertEqual(table.probe(0x123), (3, 50, EXACT, 7))
+        self.assertIsNone(table.probe(0x133 + (1 << 20)))
+
+    def test_deeper_entry_is_kept(self):
+        table = TranspositionTable(size_bits=4)
+        table.store(0x123, 5, 50, EXACT, 7)
+        table.store(0x123, 2, 10, LOWER_BOUND, 8)
+        self.assertEqual(table.probe(0x123), (5, 50, EXACT, 7))
+        table.store(0x113, 1, 10, LOWER_BOUND, 8)
+        self.assertEqual(table.probe(0x113), (1, 10, LOWER_BOUND, 8))
+        self.assertIsNone(table.probe(0x123))
+
+
+class TestEvaluation(unittest.TestCase):
+    @parameterized.expand([
+        ["111111111111000000003333333333330", 0, 0],
+        ["200000000000010000000100040000000", 200, 210],
+        ["000000000000000000001000000000030", 0, 10]
+    ])
+    def test_evaluation(self, state, material, positional):
+        position = Position.from_state(state)
+        self.assertEqual(material_evaluation(position), material)
+        self.assertEqual(positional_evaluation(position), positional)
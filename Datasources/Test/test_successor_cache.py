@@ -0,0 +1,90 @@
+import unittest
+
+from parameterized import parameterized
+
+from ..ValidateMove.util.bitboard import START_STATE, find_successor_states
+from ..ValidateMove.util.successor_cache import SUCCESSOR_CACHE, SuccessorCache
+from ..ValidateMove.util.symmetry import flip_state
+from ..ValidateMove.util.validate_move import MoveValidator
+
+WHITE_TO_MOVE_STATE = "111111111111000003003303333333331"
+CAPTURE_STATE = "111111111110000100303303333333330"
+MULTI_CAPTURE_STATE = "101111010010013033000003003333030"
+
+
+class TestSuccessorCache(unittest.TestCase):
+    def test_successors_are_computed_once(self):
+        cache = SuccessorCache(max_size=2)
+        first = cache.successors(START_STATE, "black")
+        second = cache.successors(START_STATE, "black")
+
+        self.assertEqual(first, frozenset(find_successor_states(START_STATE, "black")))
+        self.assertIs(first, second)
+        self.assertEqual(cache.stats(), {"size": 1, "maxSize": 2, "hits": 1, "misses": 1, "evictions": 0})
+
+    def test_colour_is_part_of_key(self):
+        cache = SuccessorCache(max_size=2)
+        cache.successors(START_STATE, "black")
+        self.assertIsNone(cache.get(START_STATE, "white"))
+
+    def test_least_recently_used_is_evicted(self):
+        cache = SuccessorCache(max_size=2)
+        cache.successors(START_STATE, "black")
+        cache.successors(WHITE_TO_MOVE_STATE, "white")
+        cache.get(START_STATE, "black")
+        cache.successors(CAPTURE_STATE, "black")
+
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.evictions, 1)
+        self.assertIsNone(cache.get(WHITE_TO_MOVE_STATE, "white"))
+        self.assertIsNotNone(cache.get(START_STATE, "black"))
+
+    def test_canonical_cache_shares_mirrored_positions(self):
+        cache = SuccessorCache(max_size=2, canonical=True)
+        black = cache.successors(START_STATE, "black")
+        white = cache.successors(flip_state(START_STATE), "white")
+
+        self.assertEqual(black, frozenset(find_successor_states(START_STATE, "black")))
+        self.assertEqual(white, frozenset(find_successor_states(flip_state(START_STATE), "white")))
+        self.assertEqual(len(cache), 1)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_canonical_cache_round_trip(self):
+        cache = SuccessorCache(canonical=True)
+        for state, color in ((START_STATE, "black"), (WHITE_TO_MOVE_STATE, "white"), (CAPTURE_STATE, "black")):
+            cache.successors(state, color)
+            self.assertEqual(cache.get(state, color), frozenset(find_successor_states(state, color)))
+
+    @parameterized.expand([
+        ["plain", False],
+        ["canonical", True]
+    ])
+    def test_contains(self, _, canonical):
+        cache = SuccessorCache(canonical=canonical)
+        self.assertIsNone(cache.contains(START_STATE, "black", WHITE_TO_MOVE_STATE))
+        cache.successors(START_STATE, "black")
+        self.assertTrue(cache.contains(START_STATE, "black", WHITE_TO_MOVE_STATE))
+        self.assertFalse(cache.contains(START_STATE, "black", START_STATE))
+        self.assertFalse(cache.contains(START_STATE, "black", "111111111111000003003303333333333x"))
+        self.assertFalse(cache.contains(START_STATE, "black", WHITE_TO_MOVE_STATE + "XYZ"))
+        self.assertEqual((cache.hits, cache.misses), (4, 2))
+
+        cache.successors(MULTI_CAPTURE_STATE, "black")
+        self.assertTrue(cache.contains(MULTI_CAPTURE_STATE, "black", "1011110130100030300000030033330328"))
+        self.assertFalse(cache.contains(MULTI_CAPTURE_STATE, "black", "10111101301000303000000300333303208"))
+        self.assertFalse(cache.contains(MULTI_CAPTURE_STATE, "black", "101111013010003030000003003333032 8"))
+
+    def test_zero_size_disables_cache(self):
+        cache = SuccessorCache(max_size=0)
+        cache.successors(START_STATE, "black")
+        self.assertEqual(len(cache), 0)
+
+    def test_validate_new_state_uses_cached_successors(self):
+        SUCCESSOR_CACHE.clear()
+        SUCCESSOR_CACHE.successors(START_STATE, "black")
+        validator = MoveValidator(old_game_state=START_STATE, move_requester_color="black")
+
+        self.assertTrue(validator.validate_new_state(new_state=WHITE_TO_MOVE_STATE))
+        self.assertFalse(validator.validate_new_state(new_state="111111111111000003003303333333330"))
+        self.assertEqual(SUCCESSOR_CACHE.hits, 2)
+        SUCCESSOR_CACHE.clear()
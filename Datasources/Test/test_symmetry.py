@@ -0,0 +1,68 @@
+import unittest
+
+from parameterized import parameterized
+
+from ..Analysis.self_play import self_play_games
+from ..ValidateMove.util.bitboard import (START_STATE, Position, color_to_move, find_packed_legal_moves,
+                                          find_successor_states)
+from ..ValidateMove.util.evaluation import positional_evaluation
+from ..ValidateMove.util.symmetry import (canonical_state, flip_color, flip_move, flip_position, flip_state,
+                                          is_canonical, reverse_bits)
+from ..ValidateMove.util.zobrist import hash_mirrored_position, hash_position
+
+
+def corpus():
+    for game in self_play_games(20, seed=25):
+        yield from game
+
+
+class TestSymmetry(unittest.TestCase):
+    @parameterized.expand([
+        ["start", START_STATE, "111111111111000000003333333333331"],
+        ["kings", "200000000000000000000000000000040", "200000000000000000000000000000041"],
+        ["men", "100000000000000000000000000000001", "000000000000000000000000000000030"],
+        ["continuation", "00000000000000000000000000000100329", "0030000000000000000000000000000022"]
+    ])
+    def test_flip_state(self, _, state, expected):
+        self.assertEqual(flip_state(state), expected)
+        self.assertEqual(flip_state(expected), state)
+
+    def test_round_trip(self):
+        for state in corpus():
+            self.assertEqual(flip_state(flip_state(state)), state)
+            position = Position.from_state(state)
+            self.assertEqual(flip_position(position).to_state(), flip_state(state))
+            self.assertEqual(flip_position(flip_position(position)).to_state(), state)
+
+    def test_moves_are_mirrored(self):
+        for state in corpus():
+            color = color_to_move(state)
+            flipped = flip_state(state)
+            self.assertEqual({flip_state(new_state) for new_state in find_successor_states(state, color)},
+                             set(find_successor_states(flipped, flip_color(color))))
+            moves = find_packed_legal_moves(Position.from_state(state), color)
+            self.assertEqual(sorted(flip_move(move) for move in moves),
+                             sorted(find_packed_legal_moves(Position.from_state(flipped), flip_color(color))))
+            self.assertEqual([flip_move(flip_move(move)) for move in moves], moves)
+
+    def test_mirrored_hash(self):
+        for state in corpus():
+            position = Position.from_state(state)
+            self.assertEqual(hash_mirrored_position(position), hash_position(flip_position(position)))
+
+    def test_evaluation_is_antisymmetric(self):
+        for state in corpus():
+            position = Position.from_state(state)
+            self.assertEqual(positional_evaluation(flip_position(position)), -positional_evaluation(position))
+
+    def test_canonical_state(self):
+        self.assertFalse(is_canonical(START_STATE))
+        canonical, flipped = canonical_state(START_STATE)
+        self.assertTrue(flipped)
+        self.assertTrue(is_canonical(canonical))
+        self.assertEqual(canonical_state(canonical), (canonical, False))
+
+    def test_reverse_bits(self):
+        self.assertEqual(reverse_bits(1), 1 << 31)
+        self.assertEqual(reverse_bits(0x0000000F), 0xF0000000)
+        self.assertEqual(reverse_bits(reverse_bits(0x12345678)), 0x12345678)
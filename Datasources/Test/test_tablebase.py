@@ -0,0 +1,116 @@
+import os
+import tempfile
+import unittest
+
+from parameterized import parameterized
+
+from ..Analysis.tablebase_generator import (UNKNOWN, enumerate_slice, generate, material_slices, slice_complete,
+                                            slice_dependencies, slice_levels, solve_slice)
+from ..ValidateMove.util.bitboard import find_complete_move_positions
+from ..ValidateMove.util.tablebase import (DRAW_RESULT, LOSS, WIN, Tablebase, decode_value, loss_code, position_index,
+                                           slice_file_name, slice_size, win_code)
+
+
+class TestTablebase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.TemporaryDirectory()
+        generate(cls.directory.name, 2)
+        cls.tablebase = Tablebase(cls.directory.name)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tablebase.close()
+        cls.directory.cleanup()
+
+    @parameterized.expand([
+        [(0, 1, 0, 1)],
+        [(1, 0, 1, 0)],
+        [(0, 1, 1, 0)],
+        [(1, 0, 0, 1)]
+    ])
+    def test_index_is_unique_and_in_range(self, material):
+        indices = [position_index(position) for position, _ in enumerate_slice(material)]
+        self.assertEqual(len(indices), len(set(indices)))
+        self.assertTrue(all(0 <= index < slice_size(material) for index in indices))
+
+    @parameterized.expand([
+        [(0, 1, 0, 1)],
+        [(1, 0, 1, 0)],
+        [(0, 1, 1, 0)],
+        [(1, 0, 0, 1)]
+    ])
+    def test_values_agree_with_successors(self, material):
+        for position, color in enumerate_slice(material):
+            result, distance = self.tablebase.probe_position(position)
+            successors = find_complete_move_positions(position, color)
+            codes = [self.tablebase.probe_code(successor) for successor in successors]
+            losses = [code for code in codes if code % 2 == 1 and code > 1]
+            if result == WIN:
+                self.assertEqual(min(losses), loss_code(distance - 1))
+            elif result == LOSS:
+                self.assertTrue(all(code % 2 == 0 for code in codes))
+                self.assertEqual(max(codes, default=win_code(-1)), win_code(distance - 1))
+            else:
+                self.assertFalse(losses)
+                self.assertFalse(codes and all(code % 2 == 0 for code in codes))
+
+    @parameterized.expand([
+        ["king_captures_last_piece", "200004000000000000000000000000001", (WIN, 1)],
+        ["lone_kings_draw", "200000000000000000000000000000041", (DRAW_RESULT, None)],
+        ["no_pieces_to_move", "000000000000000000000000000000010", (LOSS, 0)]
+    ])
+    def test_probe(self, _, state, expected):
+        self.assertEqual(self.tablebase.probe(state), expected)
+
+    @parameterized.expand([
+        ["continuation", "0000020000000000000000000000000435"],
+        ["not_generated", "000000000000000000000000000022241"]
+    ])
+    def test_uncovered_positions(self, _, state):
+        self.assertIsNone(self.tablebase.probe(state))
+
+    def test_decode_value(self):
+        self.assertIsNone(decode_value(0))
+        self.assertEqual(decode_value(win_code(7)), (WIN, 7))
+        self.assertEqual(decode_value(loss_code(0)), (LOSS, 0))
+
+    def test_levels_follow_dependencies(self):
+        levels = slice_levels(material_slices(4))
+        self.assertEqual(sum(len(level) for level in levels), len(material_slices(4)))
+        self.assertEqual(levels[0], [(0, 1, 0, 1)])
+
+    @parameterized.expand([
+        [(0, 1, 0, 3), {(0, 1, 0, 1), (0, 1, 0, 2), (0, 1, 0, 3)}],
+        [(1, 0, 1, 0), {(1, 0, 1, 0), (0, 1, 1, 0), (1, 0, 0, 1), (0, 1, 0, 1)}],
+        [(2, 0, 0, 1), {(2, 0, 0, 1), (1, 1, 0, 1), (0, 2, 0, 1), (1, 0, 0, 1), (0, 1, 0, 1)}]
+    ])
+    def test_slice_dependencies(self, material, expected_result):
+        self.assertEqual(slice_dependencies(material), expected_result)
+
+    def test_generate_targets(self):
+        directory = os.path.join(self.directory.name, "targets")
+        generate(directory, 2, targets=[(1, 0, 0, 1)])
+        self.assertEqual(sorted(os.listdir(directory)), ["00010001.tb", "01000001.tb"])
+        with open(os.path.join(directory, "01000001.tb"), "rb") as slice_file:
+            self.assertEqual(solve_slice(directory, (1, 0, 0, 1)), slice_file.read()[16:])
+
+    def test_canonical_tablebase_matches(self):
+        directory = os.path.join(self.directory.name, "canonical")
+        generate(directory, 2, canonical=True)
+        canonical = Tablebase(directory, canonical=True)
+        for material in material_slices(2):
+            self.assertTrue(slice_complete(directory, material, canonical=True))
+            for position, _ in enumerate_slice(material):
+                self.assertEqual(canonical.probe_code(position), self.tablebase.probe_code(position))
+        canonical.close()
+        with self.assertRaises(ValueError):
+            Tablebase(directory).probe("200004000000000000000000000000001")
+
+    def test_generation_resumes(self):
+        path = os.path.join(self.directory.name, slice_file_name((0, 1, 0, 1)))
+        modified = os.path.getmtime(path)
+        generate(self.directory.name, 2)
+        self.assertEqual(os.path.getmtime(path), modified)
+        self.assertTrue(slice_complete(self.directory.name, (0, 1, 0, 1)))
+        self.assertNotIn(UNKNOWN, open(path, "rb").read()[16:])
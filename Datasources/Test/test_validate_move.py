@@ -2,6 +2,8 @@ import unittest
 
 from parameterized import parameterized
 
+from ..ValidateMove.util.legal_moves import describe_move, describe_move_chain
+from ..ValidateMove.util.move import Move
 from ..ValidateMove.util.validate_move import MoveValidator
 
 
@@ -128,3 +130,59 @@ class TestMoveValidator(unittest.TestCase):
                                   move_requester_color="black")
         result = validator.validate_new_state(new_state="111111113111000000003303333333331")
         self.assertTrue(result)
+
+    def test_capture_chain(self):
+        validator = MoveValidator(old_game_state="100000000000010000000100030000000",
+                                  move_requester_color="black")
+        result = validator.validate_capture_chain(new_state="100000000300000000000000000000001")
+        self.assertEqual(result, ["10000000000001003000000000000000216", "100000000300000000000000000000001"])
+
+    def test_incomplete_capture_chain_invalid(self):
+        validator = MoveValidator(old_game_state="100000000000010000000100030000000",
+                                  move_requester_color="black")
+        result = validator.validate_capture_chain(new_state="10000000000001003000000000000000216")
+        self.assertIsNone(result)
+
+    def test_find_valid_moves(self):
+        validator = MoveValidator(old_game_state="100000000000010000000100030000000",
+                                  move_requester_color="black")
+        result = validator.find_valid_moves()
+        self.assertEqual(result, [([Move(25, 16, 3, 21), Move(16, 9, 3, 13)],
+                                   ["10000000000001003000000000000000216", "100000000300000000000000000000001"])])
+
+    def test_find_valid_moves_matches_valid_new_states(self):
+        validator = MoveValidator(old_game_state="111111111111000000003333333333330",
+                                  move_requester_color="black")
+        result = validator.find_valid_moves()
+        self.assertEqual([states for _, states in result], [[state] for state in validator.find_all_valid_new_states()])
+        self.assertTrue(all(moves[0].capture_location is None for moves, _ in result))
+
+    def test_valid_move_chains_can_be_played(self):
+        validator = MoveValidator(old_game_state="100000000000010000000100030000000",
+                                  move_requester_color="black")
+        for moves, states in validator.find_valid_moves():
+            description = describe_move_chain(moves, states)
+            self.assertEqual(description, {
+                "from": 25,
+                "to": 9,
+                "captures": [21, 13],
+                "promotion": False,
+                "captureChain": True,
+                "resultingState": "100000000300000000000000000000001"
+            })
+            self.assertEqual(validator.validate_capture_chain(description["resultingState"]), states)
+
+    def test_describe_single_move(self):
+        self.assertEqual(describe_move(Move(5, 1, 3), "040000000000000000000000000000001"), {
+            "from": 5,
+            "to": 1,
+            "captures": [],
+            "promotion": True,
+            "captureChain": False,
+            "resultingState": "040000000000000000000000000000001"
+        })
+
+    def test_find_valid_moves_not_players_turn(self):
+        validator = MoveValidator(old_game_state="111111111111000000003333333333330",
+                                  move_requester_color="white")
+        self.assertEqual(validator.find_valid_moves(), [])
@@ -0,0 +1,50 @@
+import unittest
+
+import numpy as np
+from parameterized import parameterized
+
+from ..Analysis.self_play import self_play_games
+from ..Analysis.vector_evaluation import TERMS, boards_from_states, evaluate_board_reference, evaluate_boards, \
+    evaluation_terms
+
+
+def flip(state):
+    # Rotated half a turn with the colours swapped
+    return state[31::-1].translate(str.maketrans("1234", "3412"))
+
+
+class TestVectorEvaluation(unittest.TestCase):
+    def test_boards_from_states(self):
+        boards = boards_from_states(["111111111111000000003333333333330", "0001101114010010030033030003333329"])
+        self.assertEqual(boards.shape, (2, 32))
+        self.assertEqual(boards.dtype, np.int8)
+        self.assertEqual(boards[1].tolist(), [int(piece) for piece in "00011011140100100300330300033333"])
+
+    @parameterized.expand([
+        ["111111111111000000003333333333330", 0],
+        ["000000000000000000000000000000000", 0],
+        ["100000000000000000000000000000000", 108],
+        ["000000000000000000001000000000000", 115],
+        ["000000000000000000000000000040000", -150]
+    ])
+    def test_known_scores(self, state, expected_result):
+        self.assertEqual(evaluate_boards(boards_from_states([state]))[0], expected_result)
+        self.assertEqual(evaluate_board_reference(state[:32]), expected_result)
+
+    def test_matches_reference_on_self_play(self):
+        states = [state for game in self_play_games(20, seed=22) for state in game]
+        scores = evaluate_boards(boards_from_states(states))
+        self.assertEqual(scores.tolist(), [evaluate_board_reference(state[:32]) for state in states])
+
+    def test_terms_add_up_to_score(self):
+        states = [state for game in self_play_games(5, seed=22) for state in game]
+        boards = boards_from_states(states)
+        terms = evaluation_terms(boards)
+        self.assertEqual(set(terms), set(TERMS))
+        self.assertEqual(sum(terms.values()).tolist(), evaluate_boards(boards).tolist())
+
+    def test_colour_flip_negates_score(self):
+        states = [state for game in self_play_games(5, seed=22) for state in game]
+        scores = evaluate_boards(boards_from_states(states))
+        flipped_scores = evaluate_boards(boards_from_states([flip(state) for state in states]))
+        self.assertEqual(flipped_scores.tolist(), (-scores).tolist())
@@ -0,0 +1,35 @@
+import unittest
+
+from ..Analysis.self_play import self_play_games
+from ..ValidateMove.util.bitboard import START_STATE, Position, apply_move, color_to_move, find_packed_legal_moves
+from ..ValidateMove.util.zobrist import hash_position, hash_state, update_hash
+
+
+class TestZobrist(unittest.TestCase):
+    def test_hash_is_deterministic(self):
+        self.assertEqual(hash_state(START_STATE), hash_state(START_STATE))
+        self.assertEqual(hash_state(START_STATE), hash_position(Position.from_state(START_STATE)))
+
+    def test_side_to_move_and_continuation_change_hash(self):
+        hashes = {hash_state("0001101114010010030033030003333329"),
+                  hash_state("0001101114010010030033030003333339"),
+                  hash_state("0001101114010010030033030003333320"),
+                  hash_state("000110111401001003003303000333330"),
+                  hash_state("000110111401001003003303000333331")}
+        self.assertEqual(len(hashes), 5)
+
+    def test_incremental_update_matches_full_hash(self):
+        for states in self_play_games(30, seed=3):
+            for state in states:
+                position = Position.from_state(state)
+                color = color_to_move(state)
+                key = hash_position(position)
+                for move in find_packed_legal_moves(position, color):
+                    new_position = apply_move(position, move, color)
+                    self.assertEqual(update_hash(key, position, move, new_position), hash_position(new_position))
+
+    def test_no_collisions_in_self_play_corpus(self):
+        states = set()
+        for game_states in self_play_games(300, seed=11):
+            states.update(game_states)
+        self.assertEqual(len({hash_state(state) for state in states}), len(states))
@@ -0,0 +1,56 @@
+import os
+import time
+
+import boto3
+from handler import fetch_game_from_dynamodb
+from util.bitboard import TURN_COLORS, apply_move
+from util.codec import encode_state
+from util.game_update import load_current_state
+from util.legal_moves import describe_move
+from util.move import Move
+from util.search import Searcher
+
+DEFAULT_BUDGET_MS = int(os.environ.get("HINT_DEFAULT_BUDGET_MS", 200))
+MAX_BUDGET_MS = int(os.environ.get("HINT_MAX_BUDGET_MS", 1000))
+# Shared by every hint served from this container, so a warm table carries over between requests
+SEARCHER = Searcher(table_bits=int(os.environ.get("HINT_TABLE_BITS", 18)),
+                    canonical=os.environ.get("HINT_CANONICAL_TABLE", "false").lower() == "true")
+
+
+def lambda_handler(event, context):
+    started = time.perf_counter()
+    game_id = event["arguments"]["gameId"]
+    budget_ms = event["arguments"].get("budgetMs")
+    # Only a missing budget takes the default, an explicit 0 is clamped like any other out of range value
+    if budget_ms is None:
+        budget_ms = DEFAULT_BUDGET_MS
+    budget_ms = min(max(budget_ms, 1), MAX_BUDGET_MS)
+
+    dynamodb = boto3.client("dynamodb", "eu-west-1")
+    item = fetch_game_from_dynamodb(dynamodb, game_id).get("Item")
+    if item is None or item.get("gameResult") is not None:
+        return None
+
+    game_state, compact = load_current_state(item)
+
+    # The budget covers the whole request, not only the search
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    result = SEARCHER.search_with_budget(game_state.state, max(budget_ms - elapsed_ms, 0))
+    if result is None:
+        return None
+
+    principal_variation = []
+    position = game_state.position
+    for move in result.principal_variation:
+        position = apply_move(position, move, TURN_COLORS[position.turn])
+        principal_variation.append(position.to_state())
+    if compact:
+        principal_variation = [encode_state(state) for state in principal_variation]
+
+    return {
+        "move": describe_move(Move.from_packed(result.move), encode_state(result.state) if compact else result.state),
+        "score": result.score,
+        "depth": result.depth,
+        "nodes": result.nodes,
+        "principalVariation": principal_variation
+    }
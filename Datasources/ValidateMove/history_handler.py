@@ -0,0 +1,6 @@
+from util.history import game_state_history
+
+
+def lambda_handler(event, context):
+    # AppSync batches the Game objects of one response into a single invocation, answered in the same order
+    return [game_state_history(request["source"]) for request in event]
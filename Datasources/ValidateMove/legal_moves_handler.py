@@ -0,0 +1,21 @@
+import boto3
+from handler import fetch_game_from_dynamodb
+from util.codec import encode_state
+from util.game_update import load_current_state
+from util.legal_moves import describe_move_chain
+from util.validate_move import MoveValidator
+
+
+def lambda_handler(event, context):
+    game_id = event["arguments"]["gameId"]
+
+    dynamodb = boto3.client("dynamodb", "eu-west-1")
+    item = fetch_game_from_dynamodb(dynamodb, game_id).get("Item")
+    if item is None or item.get("gameResult") is not None:
+        return []
+
+    game_state, compact = load_current_state(item)
+    move_validator = MoveValidator(game_state.state, game_state.color_to_move)
+    return [describe_move_chain(moves, [encode_state(state) for state in states] if compact else states)
+            for moves, states in move_validator.find_valid_moves()]
+
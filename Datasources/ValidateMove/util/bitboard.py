@@ -0,0 +1,491 @@
+from .move import CAPTURE_FLAG, CAPTURE_SHIFT, END_SHIFT, PIECE_TYPE_MASK, PIECE_TYPE_SHIFT, SQUARE_MASK, Move, \
+    pack_move
+
+FORWARD_LEFT = "forward_left"
+FORWARD_RIGHT = "forward_right"
+BACK_LEFT = "back_left"
+BACK_RIGHT = "back_right"
+
+DIRECTIONS = (FORWARD_LEFT, FORWARD_RIGHT, BACK_LEFT, BACK_RIGHT)
+
+OPPOSITE_DIRECTION = {
+    FORWARD_LEFT: BACK_RIGHT,
+    FORWARD_RIGHT: BACK_LEFT,
+    BACK_LEFT: FORWARD_RIGHT,
+    BACK_RIGHT: FORWARD_LEFT
+}
+
+# Same direction order as MoveValidator.get_directions, so generated moves keep the legacy order
+PIECE_DIRECTIONS = {
+    1: (BACK_LEFT, BACK_RIGHT),
+    2: (FORWARD_RIGHT, FORWARD_LEFT, BACK_RIGHT, BACK_LEFT),
+    3: (FORWARD_RIGHT, FORWARD_LEFT),
+    4: (FORWARD_RIGHT, FORWARD_LEFT, BACK_RIGHT, BACK_LEFT)
+}
+
+MAN_DIRECTIONS = {
+    "white": (BACK_LEFT, BACK_RIGHT),
+    "black": (FORWARD_LEFT, FORWARD_RIGHT)
+}
+
+CONTINUATION_TURNS = ("2", "3")
+
+# A continuation belongs to the side that started the capture
+TURN_COLORS = {
+    "0": "black",
+    "1": "white",
+    "2": "black",
+    "3": "white"
+}
+
+START_STATE = "111111111111000000003333333333330"
+
+# A man reaching the far row is crowned
+WHITE_PROMOTION_SQUARES = range(28, 32)
+BLACK_PROMOTION_SQUARES = range(0, 4)
+
+PIECE_CHARACTERS = "01234"
+
+FULL_BOARD = 0xFFFFFFFF
+
+WHITE_PIECES_TRANSLATION = str.maketrans("01234", "01100")
+BLACK_PIECES_TRANSLATION = str.maketrans("01234", "00011")
+KINGS_TRANSLATION = str.maketrans("01234", "00101")
+
+
+def color_to_move(state):
+    return TURN_COLORS.get(state[32:33])
+
+
+def _neighbour(square, direction):
+    row, column = divmod(square, 4)
+    x = 2 * column + (1 - row % 2)
+    row += -1 if direction in (FORWARD_LEFT, FORWARD_RIGHT) else 1
+    x += -1 if direction in (FORWARD_LEFT, BACK_LEFT) else 1
+    if row < 0 or row > 7 or x < 0 or x > 7:
+        return None
+    return row * 4 + x // 2
+
+
+def _build_neighbours():
+    return {direction: tuple(_neighbour(square, direction) for square in range(32)) for direction in DIRECTIONS}
+
+
+def _build_jumps():
+    jumps = {}
+    for direction in DIRECTIONS:
+        squares = []
+        for square in range(32):
+            captured = NEIGHBOURS[direction][square]
+            landing = None if captured is None else NEIGHBOURS[direction][captured]
+            squares.append(None if landing is None else (captured, landing))
+        jumps[direction] = tuple(squares)
+    return jumps
+
+
+def _build_packed_moves():
+    packed_steps = {}
+    packed_jumps = {}
+    for direction in DIRECTIONS:
+        packed_steps[direction] = tuple(None if neighbour is None else square | neighbour << END_SHIFT
+                                        for square, neighbour in enumerate(NEIGHBOURS[direction]))
+        packed_jumps[direction] = tuple(None if jump is None else
+                                        square | jump[1] << END_SHIFT | jump[0] << CAPTURE_SHIFT | CAPTURE_FLAG
+                                        for square, jump in enumerate(JUMPS[direction]))
+    return packed_steps, packed_jumps
+
+
+def _build_step_shifts():
+    step_shifts = {}
+    for direction in DIRECTIONS:
+        masks = {}
+        for square, neighbour in enumerate(NEIGHBOURS[direction]):
+            if neighbour is None:
+                continue
+            delta = neighbour - square
+            masks[delta] = masks.get(delta, 0) | 1 << square
+        step_shifts[direction] = tuple(masks.items())
+    return step_shifts
+
+
+# direction -> neighbour square for every square, None off the board
+NEIGHBOURS = _build_neighbours()
+# direction -> (captured square, landing square) for every square, None off the board
+JUMPS = _build_jumps()
+# direction -> packed move without its piece type for every square, None off the board
+PACKED_STEPS, PACKED_JUMPS = _build_packed_moves()
+# direction -> ((shift, source mask), ...), one entry per row parity
+STEP_SHIFTS = _build_step_shifts()
+
+
+def _step(bits, direction):
+    (delta_a, mask_a), (delta_b, mask_b) = STEP_SHIFTS[direction]
+    if delta_a < 0:
+        return (bits & mask_a) >> -delta_a | (bits & mask_b) >> -delta_b
+    return (bits & mask_a) << delta_a | (bits & mask_b) << delta_b
+
+
+class Position:
+    __slots__ = ("white", "black", "kings", "turn", "continuation_square")
+
+    def __init__(self, white, black, kings, turn="0", continuation_square=None):
+        self.white = white
+        self.black = black
+        self.kings = kings
+        self.turn = turn
+        self.continuation_square = continuation_square
+
+    @classmethod
+    def from_state(cls, state):
+        # Square 0 is the lowest bit, so the board is read back to front
+        board = state[31::-1]
+        if len(board) != 32 or board.strip(PIECE_CHARACTERS):
+            raise ValueError("Invalid board value")
+        turn = state[32:33]
+        continuation_square = int(state[33:]) if turn in CONTINUATION_TURNS else None
+        return cls(int(board.translate(WHITE_PIECES_TRANSLATION), 2),
+                   int(board.translate(BLACK_PIECES_TRANSLATION), 2),
+                   int(board.translate(KINGS_TRANSLATION), 2),
+                   turn,
+                   continuation_square)
+
+    def to_state(self):
+        board = ["0"] * 32
+        for bits, piece in ((self.white & ~self.kings, "1"), (self.white & self.kings, "2"),
+                            (self.black & ~self.kings, "3"), (self.black & self.kings, "4")):
+            while bits:
+                lowest = bits & -bits
+                board[lowest.bit_length() - 1] = piece
+                bits ^= lowest
+        state = "".join(board) + self.turn
+        if self.continuation_square is not None:
+            state += str(self.continuation_square)
+        return state
+
+    def piece_type_at(self, square):
+        bit = 1 << square
+        king = 1 if self.kings & bit else 0
+        if self.white & bit:
+            return 1 + king
+        if self.black & bit:
+            return 3 + king
+        return 0
+
+    def empty(self):
+        return ~(self.white | self.black) & FULL_BOARD
+
+
+def _movable_sources(position, color, capture):
+    if color == "black":
+        own, opponent, man_directions = position.black, position.white, MAN_DIRECTIONS["black"]
+    else:
+        own, opponent, man_directions = position.white, position.black, MAN_DIRECTIONS["white"]
+    own_kings = own & position.kings
+    empty = ~(position.white | position.black) & FULL_BOARD
+
+    sources = {}
+    for direction in DIRECTIONS:
+        pieces = own if direction in man_directions else own_kings
+        if not pieces:
+            continue
+        back = OPPOSITE_DIRECTION[direction]
+        targets = _step(empty, back)
+        if capture:
+            targets = _step(targets & opponent, back)
+        if pieces & targets:
+            sources[direction] = pieces & targets
+    return sources
+
+
+def _generate_moves(position, color, capture):
+    # Builds packed moves in the legacy MoveValidator order
+    moves = []
+    sources = _movable_sources(position, color, capture)
+    if not sources:
+        return moves
+    movable = 0
+    for bits in sources.values():
+        movable |= bits
+    man_type = 3 if color == "black" else 1
+    kings = position.kings
+    packed_moves = PACKED_JUMPS if capture else PACKED_STEPS
+
+    while movable:
+        lowest = movable & -movable
+        square = lowest.bit_length() - 1
+        movable ^= lowest
+        piece_type = man_type + 1 if kings & lowest else man_type
+        piece_type_bits = piece_type << PIECE_TYPE_SHIFT
+        for direction in PIECE_DIRECTIONS[piece_type]:
+            if sources.get(direction, 0) & lowest:
+                moves.append(packed_moves[direction][square] | piece_type_bits)
+    return moves
+
+
+def _generate_captures_from(position, square, piece_type):
+    if piece_type == 1 or piece_type == 2:
+        opponent = position.black
+    elif piece_type == 3 or piece_type == 4:
+        opponent = position.white
+    else:
+        return
+    empty = position.empty()
+
+    for direction in PIECE_DIRECTIONS[piece_type]:
+        jump = JUMPS[direction][square]
+        if jump is None:
+            continue
+        captured, landing = jump
+        if opponent >> captured & 1 and empty >> landing & 1:
+            yield PACKED_JUMPS[direction][square] | piece_type << PIECE_TYPE_SHIFT
+
+
+def _generate_legal_moves(position, color):
+    if position.continuation_square is not None:
+        square = position.continuation_square
+        moves = list(_generate_captures_from(position, square, position.piece_type_at(square)))
+        if moves:
+            return moves
+
+    moves = _generate_moves(position, color, capture=True)
+    if moves:
+        return moves
+
+    return _generate_moves(position, color, capture=False)
+
+
+def find_quiet_moves(position, color):
+    return [Move.from_packed(move) for move in _generate_moves(position, color, capture=False)]
+
+
+def find_captures(position, color):
+    return [Move.from_packed(move) for move in _generate_moves(position, color, capture=True)]
+
+
+def find_captures_from(position, square):
+    return [Move.from_packed(move)
+            for move in _generate_captures_from(position, square, position.piece_type_at(square))]
+
+
+def find_legal_moves(position, color):
+    return [Move.from_packed(move) for move in _generate_legal_moves(position, color)]
+
+
+def find_packed_legal_moves(position, color):
+    return _generate_legal_moves(position, color)
+
+
+def _generate_state(position, board, move, color):
+    start = move & SQUARE_MASK
+    end = move >> END_SHIFT & SQUARE_MASK
+    piece_type = move >> PIECE_TYPE_SHIFT & PIECE_TYPE_MASK
+    new_state = board[:]
+    new_state[start] = "0"
+    if piece_type == 1 and end >= 28 or piece_type == 3 and end <= 3:
+        new_state[end] = PIECE_CHARACTERS[piece_type + 1]
+    else:
+        new_state[end] = PIECE_CHARACTERS[piece_type]
+    new_state[32] = "1" if color == "black" else "0"
+
+    if move & CAPTURE_FLAG:
+        new_state[move >> CAPTURE_SHIFT & SQUARE_MASK] = "0"
+        # The turn only continues when the moving piece, with its pre-promotion directions, can capture again
+        for _ in _generate_captures_from(position, end, piece_type):
+            new_state[32] = "2" if color == "black" else "3"
+            new_state.append(str(end))
+            break
+    return "".join(new_state)
+
+
+def apply_move(position, move, color):
+    start_bit = 1 << (move & SQUARE_MASK)
+    end = move >> END_SHIFT & SQUARE_MASK
+    end_bit = 1 << end
+    piece_type = move >> PIECE_TYPE_SHIFT & PIECE_TYPE_MASK
+    white = position.white
+    black = position.black
+    kings = position.kings
+
+    if piece_type == 1 or piece_type == 2:
+        white = white ^ start_bit | end_bit
+    else:
+        black = black ^ start_bit | end_bit
+    if kings & start_bit:
+        kings = kings ^ start_bit | end_bit
+    elif piece_type == 1 and end >= 28 or piece_type == 3 and end <= 3:
+        kings |= end_bit
+
+    continues = False
+    if move & CAPTURE_FLAG:
+        captured_bit = ~(1 << (move >> CAPTURE_SHIFT & SQUARE_MASK))
+        white &= captured_bit
+        black &= captured_bit
+        kings &= captured_bit
+        next_position = Position(white, black, kings)
+        for _ in _generate_captures_from(next_position, end, piece_type):
+            continues = True
+            break
+
+    if color == "black":
+        turn = "2" if continues else "1"
+    else:
+        turn = "3" if continues else "0"
+    return Position(white, black, kings, turn, end if continues else None)
+
+
+def _walk_capture_chains(position, color, chain, positions, chains):
+    next_position = apply_move(position, chain[-1], color)
+    positions = positions + (next_position,)
+    if next_position.continuation_square is None:
+        chains.append((chain, positions))
+        return
+    square = next_position.continuation_square
+    for move in _generate_captures_from(next_position, square, next_position.piece_type_at(square)):
+        _walk_capture_chains(next_position, color, chain + (move,), positions, chains)
+
+
+def _generate_capture_chains(position, color):
+    # Depth first over every capture sequence, each one followed until the capturing piece has to stop
+    first_moves = _generate_legal_moves(position, color)
+    chains = []
+    if not first_moves or not first_moves[0] & CAPTURE_FLAG:
+        return chains
+    for move in first_moves:
+        _walk_capture_chains(position, color, (move,), (), chains)
+    return chains
+
+
+def find_complete_move_positions(position, color):
+    # The position after every complete move, a multi-jump counting as one move
+    moves = _generate_legal_moves(position, color)
+    if not moves or not moves[0] & CAPTURE_FLAG:
+        return [apply_move(position, move, color) for move in moves]
+    chains = []
+    for move in moves:
+        _walk_capture_chains(position, color, (move,), (), chains)
+    return [positions[-1] for _, positions in chains]
+
+
+def find_capture_chains(position, color):
+    return [chain for chain, _ in _generate_capture_chains(position, color)]
+
+
+def find_capture_chain_states(state, color):
+    position = Position.from_state(state)
+    return [tuple(chain_position.to_state() for chain_position in positions)
+            for _, positions in _generate_capture_chains(position, color)]
+
+
+def find_successor_states(state, color):
+    position = Position.from_state(state)
+    board = list(state[:33])
+    return [_generate_state(position, board, move, color) for move in _generate_legal_moves(position, color)]
+
+
+def find_complete_moves_with_states(state, color):
+    # Every complete move as its hops and the state after each hop, a multi-jump being a single entry
+    position = Position.from_state(state)
+    chains = _generate_capture_chains(position, color)
+    if chains:
+        return [(chain, tuple(chain_position.to_state() for chain_position in positions))
+                for chain, positions in chains]
+    board = list(state[:33])
+    return [((move,), (_generate_state(position, board, move, color),))
+            for move in _generate_legal_moves(position, color)]
+
+
+def has_captures(position, color):
+    return bool(_movable_sources(position, color, capture=True))
+
+
+def has_legal_moves(position, color):
+    # Stops at the first continuation capture, capture or quiet move instead of building any of them
+    if position.continuation_square is not None:
+        square = position.continuation_square
+        for _ in _generate_captures_from(position, square, position.piece_type_at(square)):
+            return True
+
+    if color == "black":
+        own, opponent, man_directions = position.black, position.white, MAN_DIRECTIONS["black"]
+    else:
+        own, opponent, man_directions = position.white, position.black, MAN_DIRECTIONS["white"]
+    own_kings = own & position.kings
+    empty = ~(position.white | position.black) & FULL_BOARD
+
+    for direction in DIRECTIONS:
+        pieces = own if direction in man_directions else own_kings
+        if not pieces:
+            continue
+        back = OPPOSITE_DIRECTION[direction]
+        targets = _step(empty, back)
+        if pieces & targets or pieces & _step(targets & opponent, back):
+            return True
+    return False
+
+
+def has_any_legal_move(state, color):
+    return has_legal_moves(Position.from_state(state), color)
+
+
+def decode_move(position, new_position):
+    # Recovers the single packed hop between two boards, or None if there is none
+    old_occupied = position.white | position.black
+    new_occupied = new_position.white | new_position.black
+    arrived = new_occupied & ~old_occupied
+    vacated = old_occupied & ~new_occupied
+    if not arrived or arrived & (arrived - 1):
+        return None
+
+    own = position.white if new_position.white & arrived else position.black
+    start_bits = vacated & own
+    captured_bits = vacated & ~own
+    if not start_bits or start_bits & (start_bits - 1) or captured_bits & (captured_bits - 1):
+        return None
+
+    # Every square that was not moved from, moved to or captured must be untouched
+    unchanged = ~(arrived | vacated)
+    if (position.white ^ new_position.white) & unchanged or (position.black ^ new_position.black) & unchanged \
+            or (position.kings ^ new_position.kings) & unchanged:
+        return None
+
+    start = start_bits.bit_length() - 1
+    captured = captured_bits.bit_length() - 1 if captured_bits else None
+    return pack_move(start, arrived.bit_length() - 1, position.piece_type_at(start), captured)
+
+
+def _is_legal_hop(move, color):
+    piece_type = move >> PIECE_TYPE_SHIFT & PIECE_TYPE_MASK
+    if piece_type not in ((3, 4) if color == "black" else (1, 2)):
+        return False
+    packed_moves = PACKED_JUMPS if move & CAPTURE_FLAG else PACKED_STEPS
+    hop = move & ~(PIECE_TYPE_MASK << PIECE_TYPE_SHIFT)
+    start = move & SQUARE_MASK
+    for direction in PIECE_DIRECTIONS[piece_type]:
+        if packed_moves[direction][start] == hop:
+            return True
+    return False
+
+
+def is_valid_transition(state, new_state, color):
+    position = Position.from_state(state)
+    try:
+        new_position = Position.from_state(new_state)
+    except ValueError:
+        return False
+    move = decode_move(position, new_position)
+    if move is None:
+        return False
+
+    continuation_captures = None
+    if position.continuation_square is not None:
+        square = position.continuation_square
+        continuation_captures = list(_generate_captures_from(position, square, position.piece_type_at(square)))
+    if continuation_captures:
+        if move not in continuation_captures:
+            return False
+    elif not move & CAPTURE_FLAG and has_captures(position, color):
+        return False
+    elif not _is_legal_hop(move, color):
+        return False
+
+    return _generate_state(position, list(state[:33]), move, color) == new_state
@@ -0,0 +1,72 @@
+import base64
+
+from .bitboard import CONTINUATION_TURNS, Position
+
+POSITION_SIZE = 12
+TURNS = ("0", "1", "2", "3")
+# A legal game never has more than 24 pieces, which leaves the top byte of the kings word for the turn
+MAX_PIECES = 24
+TURN_SHIFT = 24
+CONTINUATION_SHIFT = 26
+CONTINUATION_FLAG = 1 << 31
+COMPACT_ENCODING = "COMPACT"
+LEGACY_ENCODING = "LEGACY"
+
+
+def pack_position(position):
+    # white and black are stored as they are, kings only for the occupied squares in square order
+    occupied = position.white | position.black
+    if bin(occupied).count("1") > MAX_PIECES:
+        raise ValueError("Too many pieces to encode")
+    if position.turn not in TURNS:
+        raise ValueError("Invalid turn value")
+    if position.continuation_square is not None and not 0 <= position.continuation_square < 32:
+        raise ValueError("Invalid continuation square")
+    kings = 0
+    index = 0
+    while occupied:
+        lowest = occupied & -occupied
+        if position.kings & lowest:
+            kings |= 1 << index
+        index += 1
+        occupied ^= lowest
+    kings |= int(position.turn) << TURN_SHIFT
+    if position.continuation_square is not None:
+        kings |= position.continuation_square << CONTINUATION_SHIFT | CONTINUATION_FLAG
+    return position.white.to_bytes(4, "little") + position.black.to_bytes(4, "little") + kings.to_bytes(4, "little")
+
+
+def unpack_position(data):
+    if len(data) != POSITION_SIZE:
+        raise ValueError("Invalid compact position length")
+    white = int.from_bytes(data[0:4], "little")
+    black = int.from_bytes(data[4:8], "little")
+    packed_kings = int.from_bytes(data[8:12], "little")
+    if white & black:
+        raise ValueError("Square occupied by both colours")
+    occupied = white | black
+    kings = 0
+    index = 0
+    while occupied:
+        lowest = occupied & -occupied
+        if packed_kings >> index & 1:
+            kings |= lowest
+        index += 1
+        occupied ^= lowest
+    turn = str(packed_kings >> TURN_SHIFT & 0x3)
+    continuation_square = packed_kings >> CONTINUATION_SHIFT & 0x1F if packed_kings & CONTINUATION_FLAG else None
+    if (continuation_square is not None) != (turn in CONTINUATION_TURNS):
+        raise ValueError("Continuation square does not match the turn")
+    return Position(white, black, kings, turn, continuation_square)
+
+
+def encode_state(state):
+    return base64.b64encode(pack_position(Position.from_state(state))).decode("ascii")
+
+
+def decode_state(encoded_state):
+    try:
+        data = base64.b64decode(encoded_state, validate=True)
+    except ValueError:
+        raise ValueError("Invalid compact position encoding")
+    return unpack_position(data).to_state()
@@ -0,0 +1,24 @@
+# Scores are from white's point of view, the search flips them for black
+MAN_VALUE = 100
+KING_VALUE = 150
+ADVANCEMENT_VALUE = 10
+# Men in the opponent's half, one move closer to promotion than the rest
+WHITE_ADVANCED_SQUARES = 0x0FFF0000
+BLACK_ADVANCED_SQUARES = 0x0000FFF0
+
+
+def _count(bits):
+    return bin(bits).count("1")
+
+
+def material_evaluation(position):
+    kings = position.kings
+    return MAN_VALUE * (_count(position.white & ~kings) - _count(position.black & ~kings)) \
+        + KING_VALUE * (_count(position.white & kings) - _count(position.black & kings))
+
+
+def positional_evaluation(position):
+    kings = position.kings
+    return material_evaluation(position) \
+        + ADVANCEMENT_VALUE * (_count(position.white & ~kings & WHITE_ADVANCED_SQUARES)
+                               - _count(position.black & ~kings & BLACK_ADVANCED_SQUARES))
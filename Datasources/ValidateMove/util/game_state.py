@@ -0,0 +1,65 @@
+from .bitboard import CONTINUATION_TURNS, PIECE_CHARACTERS, TURN_COLORS, Position
+
+BOARD_SIZE = 32
+MAX_STATE_LENGTH = 35
+MAX_PIECES_PER_COLOR = 12
+
+
+class GameState:
+    __slots__ = ("state", "turn", "color_to_move", "continuation_square", "_position")
+
+    def __init__(self, state, turn, color_to_move, continuation_square):
+        self.state = state
+        self.turn = turn
+        self.color_to_move = color_to_move
+        self.continuation_square = continuation_square
+        self._position = None
+
+    @classmethod
+    def parse(cls, state):
+        # Every check is a string operation, nothing is generated for a state that fails one
+        if not isinstance(state, str) or not BOARD_SIZE < len(state) <= MAX_STATE_LENGTH:
+            raise ValueError("Invalid game state length")
+        board = state[:BOARD_SIZE]
+        if board.strip(PIECE_CHARACTERS):
+            raise ValueError("Invalid board value")
+        turn = state[BOARD_SIZE]
+        color_to_move = TURN_COLORS.get(turn)
+        if color_to_move is None:
+            raise ValueError("Invalid turn value")
+
+        suffix = state[BOARD_SIZE + 1:]
+        if turn in CONTINUATION_TURNS:
+            # The engine writes the square without leading zeros
+            if not suffix.isascii() or not suffix.isdigit() or suffix != str(int(suffix)):
+                raise ValueError("Invalid continuation square")
+            continuation_square = int(suffix)
+            if continuation_square >= BOARD_SIZE:
+                raise ValueError("Continuation square out of range")
+            own_pieces = "12" if color_to_move == "white" else "34"
+            if board[continuation_square] not in own_pieces:
+                raise ValueError("Continuation square is not a piece of the colour to move")
+        elif suffix:
+            raise ValueError("Continuation square without a continuation turn")
+        else:
+            continuation_square = None
+
+        if board.count("1") + board.count("2") > MAX_PIECES_PER_COLOR \
+                or board.count("3") + board.count("4") > MAX_PIECES_PER_COLOR:
+            raise ValueError("Too many pieces")
+        return cls(state, turn, color_to_move, continuation_square)
+
+    @property
+    def position(self):
+        if self._position is None:
+            self._position = Position.from_state(self.state)
+        return self._position
+
+    def __eq__(self, other):
+        return isinstance(other, GameState) and self.state == other.state
+
+    def __hash__(self):
+        return hash(self.state)
+
+    def __str__(self):
+        return self.state
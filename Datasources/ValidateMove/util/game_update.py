@@ -0,0 +1,225 @@
+import base64
+from dataclasses import dataclass
+
+from .codec import COMPACT_ENCODING, decode_state, encode_state
+from .game_state import GameState
+from .history import encode_hops
+from .material import Material
+from .progress import NO_PROGRESS_LIMIT, is_progress_move
+from .reply_digest import build_reply_digest, digest_contains
+from .repetition import REPETITION_LIMIT, position_key
+from .successor_cache import SUCCESSOR_CACHE
+from .validate_move import MoveValidator
+
+
+@dataclass
+class GameUpdate:
+    new_game_state: str
+    new_game_states: list
+    hops: list = None
+    position_key: str = None
+    position_count: int = None
+    reset_position_counts: bool = False
+    progress: bool = None
+    material: Material = None
+    reply_digest: bytes = None
+    game_result: str = None
+    game_result_reason: str = None
+
+
+def load_current_state(item):
+    # The stored position as a GameState and whether the game is compact, raises ValueError for a malformed state
+    # Games created as compact store and receive base64 positions, everything else works on the legacy string
+    compact = item.get("stateEncoding", {}).get("S") == COMPACT_ENCODING
+    current_game_state = item["currentGameState"]["S"]
+    if compact:
+        current_game_state = decode_state(current_game_state)
+    return GameState.parse(current_game_state), compact
+
+
+def plan_move(item, user, new_game_state, capture_chain=False):
+    # Everything makeMove decides from the stored game and the request, None when the move is turned away
+    # Repetition and no-progress ties end games that still have legal moves, nothing more may be played in them
+    if item.get("gameResult") is not None:
+        return None
+
+    try:
+        old_state, compact = load_current_state(item)
+        if compact:
+            new_game_state = decode_state(new_game_state)
+        # Malformed states are turned away here, before any move generation or write
+        new_state = GameState.parse(new_game_state)
+    except ValueError:
+        return None
+    old_game_state = old_state.state
+    white_player = item["whitePlayer"]["S"]
+
+    move_requester_color = "white" if white_player == user else "black"
+    if old_state.color_to_move != move_requester_color:
+        return None
+
+    move_validator = MoveValidator(old_game_state, move_requester_color)
+    if capture_chain:
+        # newGameState is the position after a complete multi-jump, every hop is recorded in the history
+        new_game_states = move_validator.validate_capture_chain(new_game_state)
+        move_valid = new_game_states is not None
+    else:
+        new_game_states = [new_game_state]
+        # The previous move stored a digest of every legal reply, valid while it still belongs to this position
+        reply_digest = item.get("replyDigest", {}).get("B")
+        reply_digest_key = item.get("replyDigestKey", {}).get("S")
+        if reply_digest is not None and reply_digest_key == position_key(old_game_state):
+            move_valid = digest_contains(reply_digest, new_game_state)
+        else:
+            move_valid = move_validator.validate_new_state(new_game_state)
+    if not move_valid:
+        return None
+
+    turn = new_state.turn
+    game_result = None
+    result_reason = None
+    replies = None
+    material = Material.from_item(item) or Material.from_state(old_game_state)
+    material = material.apply_states(old_game_state, new_game_states)
+    # A side with nothing left has lost without generating a single move
+    color_without_pieces = material.color_without_pieces()
+    if color_without_pieces == "black":
+        game_result = "WHITE_WIN"
+        result_reason = "BLACK_HAS_NO_PIECES"
+    elif color_without_pieces == "white":
+        game_result = "BLACK_WIN"
+        result_reason = "WHITE_HAS_NO_PIECES"
+    # The opponent's successors are cached here so validating their next move is a set lookup
+    elif turn == "0":
+        replies = SUCCESSOR_CACHE.successors(new_game_state, "black")
+        if not replies:
+            game_result = "WHITE_WIN"
+            result_reason = "BLACK_CANNOT_MOVE"
+    elif turn == "1":
+        replies = SUCCESSOR_CACHE.successors(new_game_state, "white")
+        if not replies:
+            game_result = "BLACK_WIN"
+            result_reason = "WHITE_CANNOT_MOVE"
+
+    progress = is_progress_move(old_game_state, new_game_state)
+    if progress:
+        no_progress_count = 0
+    else:
+        no_progress_count = int(item.get("noProgressCount", {"N": "0"})["N"]) + 1
+    if game_result is None and no_progress_count >= NO_PROGRESS_LIMIT:
+        game_result = "TIE"
+        result_reason = "TIE_BY_NO_CAPTURE_OR_PIECE_MOVEMENT"
+
+    new_position_key = position_key(new_game_state)
+    position_counts = item.get("positionCounts", {}).get("M")
+    reset_position_counts = position_counts is None or progress
+    if reset_position_counts:
+        position_count = 1
+    else:
+        position_count = int(position_counts.get(new_position_key, {"N": "0"})["N"]) + 1
+    if game_result is None and position_count >= REPETITION_LIMIT:
+        game_result = "TIE"
+        result_reason = "TIE_BY_REPETITION"
+
+    # Games with a move list keep an ordered two byte code per hop instead of the set of full states
+    hops = encode_hops(old_game_state, new_game_states) if "moveHistory" in item else None
+
+    # Kept on the item so the opponent's move is checked without generating the replies again
+    new_reply_digest = build_reply_digest(replies) if replies else None
+
+    if compact:
+        new_game_state = encode_state(new_game_state)
+        new_game_states = [encode_state(state) for state in new_game_states]
+
+    return GameUpdate(new_game_state=new_game_state,
+                      new_game_states=new_game_states,
+                      hops=hops,
+                      position_key=new_position_key,
+                      position_count=position_count,
+                      reset_position_counts=reset_position_counts,
+                      progress=progress,
+                      material=material,
+                      reply_digest=new_reply_digest,
+                      game_result=game_result,
+                      game_result_reason=result_reason)
+
+
+def build_update_arguments(update):
+    # The UpdateExpression with its values and names, everything update_item needs besides the table and key
+    add_actions = []
+    set_actions = ['currentGameState=:gameStateValue']
+    expression_values = {
+        ':gameStateValue': {"S": update.new_game_state}
+    }
+    expression_names = {}
+
+    if update.hops is None:
+        add_actions.append('gameStateHistory :gameStateAddValue')
+        expression_values[':gameStateAddValue'] = {"SS": update.new_game_states or [update.new_game_state]}
+    else:
+        set_actions.append('moveHistory=list_append(moveHistory, :moveHistoryValue)')
+        expression_values[':moveHistoryValue'] = {"L": [{"N": str(hop)} for hop in update.hops]}
+
+    if update.position_key is not None:
+        # Counts only cover positions since the last capture or man move, anything older can't repeat
+        if update.reset_position_counts:
+            set_actions.append('positionCounts=:positionCountsValue')
+            expression_values[':positionCountsValue'] = {"M": {update.position_key: {"N": str(update.position_count)}}}
+        else:
+            set_actions.append('positionCounts.#positionKey=:positionCountValue')
+            expression_names['#positionKey'] = update.position_key
+            expression_values[':positionCountValue'] = {"N": str(update.position_count)}
+
+    if update.progress is not None:
+        # Reset or bumped in this same update so the count never depends on replaying the history
+        if update.progress:
+            set_actions.append('noProgressCount=:noProgressCountValue')
+            expression_values[':noProgressCountValue'] = {"N": "0"}
+        else:
+            add_actions.append('noProgressCount :noProgressIncrementValue')
+            expression_values[':noProgressIncrementValue'] = {"N": "1"}
+
+    if update.material is not None:
+        for attribute_name, attribute_value in update.material.to_item().items():
+            set_actions.append(f'{attribute_name}=:{attribute_name}Value')
+            expression_values[f':{attribute_name}Value'] = attribute_value
+
+    if update.reply_digest is not None:
+        set_actions.append('replyDigest=:replyDigestValue, replyDigestKey=:replyDigestKeyValue')
+        expression_values[':replyDigestValue'] = {"B": update.reply_digest}
+        expression_values[':replyDigestKeyValue'] = {"S": update.position_key}
+
+    if update.game_result:
+        set_actions.append('gameResult=:gameResultValue, gameResultReason=:gameResultReasonValue')
+        expression_values.update({
+            ':gameResultValue': {"S": update.game_result},
+            ':gameResultReasonValue': {"S": update.game_result_reason}
+        })
+
+    update_expression = 'SET ' + ', '.join(set_actions)
+    if add_actions:
+        update_expression = 'ADD ' + ', '.join(add_actions) + '  ' + update_expression
+
+    update_arguments = {
+        "UpdateExpression": update_expression,
+        "ExpressionAttributeValues": expression_values
+    }
+    if expression_names:
+        update_arguments["ExpressionAttributeNames"] = expression_names
+    return update_arguments
+
+
+def from_dynamodb_item(attributes):
+    return {key: from_dynamodb_value(value_type, value)
+            for key, value_dict in attributes.items() for value_type, value in value_dict.items()}
+
+
+def from_dynamodb_value(value_type, value):
+    if value_type == "N":
+        return int(value)
+    if value_type == "B":
+        return base64.b64encode(value).decode("ascii")
+    if value_type == "L":
+        return [from_dynamodb_value(item_type, item_value)
+                for item in value for item_type, item_value in item.items()]
+    return value
@@ -0,0 +1,54 @@
+from .bitboard import START_STATE, TURN_COLORS, Position, apply_move, decode_move, find_packed_legal_moves
+from .codec import COMPACT_ENCODING, encode_state
+
+# A hop is stored as its start and end squares, the engine works out the rest when replaying
+HOP_MASK = 0x3FF
+
+
+def encode_hops(old_game_state, new_game_states):
+    # One code per state, a capture chain gives one code for every hop
+    hops = []
+    position = Position.from_state(old_game_state)
+    for new_game_state in new_game_states:
+        new_position = Position.from_state(new_game_state)
+        move = decode_move(position, new_position)
+        if move is None:
+            raise ValueError("States are not a single hop apart")
+        hops.append(move & HOP_MASK)
+        position = new_position
+    return hops
+
+
+def replay(hops, start_state=START_STATE):
+    # Yields the start state and then the state after every hop
+    position = Position.from_state(start_state)
+    yield start_state
+    for hop in hops:
+        color = TURN_COLORS[position.turn]
+        for move in find_packed_legal_moves(position, color):
+            if move & HOP_MASK == hop:
+                position = apply_move(position, move, color)
+                break
+        else:
+            raise ValueError(f"Illegal hop {hop} in move history")
+        yield position.to_state()
+
+
+def state_at(hops, ply, start_state=START_STATE):
+    if not 0 <= ply <= len(hops):
+        raise IndexError("Ply out of range")
+    for index, state in enumerate(replay(hops[:ply], start_state)):
+        if index == ply:
+            return state
+
+
+def game_state_history(game):
+    # Every state of a game as the gameStateHistory field shows it, game being the plain attributes of the item
+    move_history = game.get("moveHistory")
+    # Games created before the move list still have their stored set of states
+    if move_history is None:
+        return game.get("gameStateHistory")
+    states = list(replay(move_history))
+    if game.get("stateEncoding") == COMPACT_ENCODING:
+        return [encode_state(state) for state in states]
+    return states
@@ -0,0 +1,22 @@
+from .bitboard import BLACK_PROMOTION_SQUARES, WHITE_PROMOTION_SQUARES
+
+
+def _promotes(move):
+    return move.piece_type == 1 and move.piece_end_location in WHITE_PROMOTION_SQUARES \
+        or move.piece_type == 3 and move.piece_end_location in BLACK_PROMOTION_SQUARES
+
+
+def describe_move_chain(moves, resulting_states):
+    # The LegalMove shape of the GraphQL schema, a multi-jump is one entry that makeMove takes with captureChain
+    return {
+        "from": moves[0].piece_start_location,
+        "to": moves[-1].piece_end_location,
+        "captures": [move.capture_location for move in moves if move.capture_location is not None],
+        "promotion": any(_promotes(move) for move in moves),
+        "captureChain": len(moves) > 1,
+        "resultingState": resulting_states[-1]
+    }
+
+
+def describe_move(move, resulting_state):
+    return describe_move_chain((move,), (resulting_state,))
@@ -0,0 +1,77 @@
+from dataclasses import dataclass
+
+from .bitboard import BLACK_PROMOTION_SQUARES, WHITE_PROMOTION_SQUARES, Position, decode_move
+from .move import CAPTURE_FLAG, CAPTURE_SHIFT, END_SHIFT, PIECE_TYPE_MASK, PIECE_TYPE_SHIFT, SQUARE_MASK
+
+
+@dataclass
+class Material:
+    # Pieces counts kings as well, kings is the part of them that has been promoted
+    white_pieces: int
+    white_kings: int
+    black_pieces: int
+    black_kings: int
+
+    @classmethod
+    def from_state(cls, state):
+        position = Position.from_state(state)
+        return cls(bin(position.white).count("1"),
+                   bin(position.white & position.kings).count("1"),
+                   bin(position.black).count("1"),
+                   bin(position.black & position.kings).count("1"))
+
+    @classmethod
+    def from_item(cls, item):
+        # Games created before the counts were stored have none, the caller recounts the board for those
+        try:
+            return cls(int(item["whitePieces"]["N"]),
+                       int(item["whiteKings"]["N"]),
+                       int(item["blackPieces"]["N"]),
+                       int(item["blackKings"]["N"]))
+        except KeyError:
+            return None
+
+    def to_item(self):
+        return {
+            "whitePieces": {"N": str(self.white_pieces)},
+            "whiteKings": {"N": str(self.white_kings)},
+            "blackPieces": {"N": str(self.black_pieces)},
+            "blackKings": {"N": str(self.black_kings)}
+        }
+
+    def apply_move(self, position, move):
+        material = Material(self.white_pieces, self.white_kings, self.black_pieces, self.black_kings)
+        if move & CAPTURE_FLAG:
+            captured_type = position.piece_type_at(move >> CAPTURE_SHIFT & SQUARE_MASK)
+            if captured_type in (1, 2):
+                material.white_pieces -= 1
+            else:
+                material.black_pieces -= 1
+            if captured_type == 2:
+                material.white_kings -= 1
+            if captured_type == 4:
+                material.black_kings -= 1
+        piece_type = move >> PIECE_TYPE_SHIFT & PIECE_TYPE_MASK
+        end = move >> END_SHIFT & SQUARE_MASK
+        if piece_type == 1 and end in WHITE_PROMOTION_SQUARES:
+            material.white_kings += 1
+        if piece_type == 3 and end in BLACK_PROMOTION_SQUARES:
+            material.black_kings += 1
+        return material
+
+    def apply_states(self, old_game_state, new_game_states):
+        # One decoded hop per state, so a whole capture chain costs as many steps as it has hops
+        material = self
+        position = Position.from_state(old_game_state)
+        for new_game_state in new_game_states:
+            new_position = Position.from_state(new_game_state)
+            material = material.apply_move(position, decode_move(position, new_position))
+            position = new_position
+        return material
+
+    def color_without_pieces(self):
+        if self.white_pieces == 0:
+            return "white"
+        if self.black_pieces == 0:
+            return "black"
+        return None
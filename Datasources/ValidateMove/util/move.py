@@ -1,5 +1,45 @@
 from dataclasses import dataclass
 
+# A packed move is a single int: start in bits 0-4, end in bits 5-9, piece type in bits 10-12,
+# captured square in bits 13-17 and bit 18 set when the move is a capture
+END_SHIFT = 5
+PIECE_TYPE_SHIFT = 10
+CAPTURE_SHIFT = 13
+CAPTURE_FLAG = 1 << 18
+SQUARE_MASK = 0x1F
+PIECE_TYPE_MASK = 0x7
+
+
+def pack_move(piece_start_location, piece_end_location, piece_type, capture_location=None):
+    packed = piece_start_location | piece_end_location << END_SHIFT | piece_type << PIECE_TYPE_SHIFT
+    if capture_location is not None:
+        packed |= capture_location << CAPTURE_SHIFT | CAPTURE_FLAG
+    return packed
+
+
+def unpack_move(packed):
+    capture_location = packed >> CAPTURE_SHIFT & SQUARE_MASK if packed & CAPTURE_FLAG else None
+    return (packed & SQUARE_MASK,
+            packed >> END_SHIFT & SQUARE_MASK,
+            packed >> PIECE_TYPE_SHIFT & PIECE_TYPE_MASK,
+            capture_location)
+
+
+def move_start(packed):
+    return packed & SQUARE_MASK
+
+
+def move_end(packed):
+    return packed >> END_SHIFT & SQUARE_MASK
+
+
+def move_piece_type(packed):
+    return packed >> PIECE_TYPE_SHIFT & PIECE_TYPE_MASK
+
+
+def move_capture(packed):
+    return packed >> CAPTURE_SHIFT & SQUARE_MASK if packed & CAPTURE_FLAG else None
+
 
 @dataclass
 class Move:
@@ -7,3 +47,10 @@ class Move:
     piece_end_location: int
     piece_type: int
     capture_location: int = None
+
+    @classmethod
+    def from_packed(cls, packed):
+        return cls(*unpack_move(packed))
+
+    def pack(self):
+        return pack_move(self.piece_start_location, self.piece_end_location, self.piece_type, self.capture_location)
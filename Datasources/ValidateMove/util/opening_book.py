@@ -0,0 +1,72 @@
+import mmap
+import struct
+from dataclasses import dataclass
+
+from .bitboard import find_successor_states
+from .zobrist import hash_state
+
+MAGIC = b"CKOB"
+VERSION = 1
+# magic, version, padding, deepest ply covered, number of entries
+HEADER = struct.Struct("<4sB3xII")
+# Zobrist key, then games, white wins, black wins and ties through the position
+ENTRY = struct.Struct("<QIIII")
+RESULTS = ("WHITE_WIN", "BLACK_WIN", "TIE")
+
+
+@dataclass(frozen=True)
+class BookEntry:
+    games: int
+    white_wins: int
+    black_wins: int
+    ties: int
+
+    def score(self, color):
+        # Share of the points the colour took from these games, a tie counting half
+        wins = self.white_wins if color == "white" else self.black_wins
+        return (wins + self.ties / 2) / self.games
+
+
+class OpeningBook:
+    # Entries are sorted by key, so the mapped file is searched as it lies on disk
+    def __init__(self, path):
+        with open(path, "rb") as book_file:
+            self.data = mmap.mmap(book_file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self.plies, self.size = HEADER.unpack_from(self.data)
+        if magic != MAGIC or version != VERSION or len(self.data) != HEADER.size + self.size * ENTRY.size:
+            self.data.close()
+            raise ValueError(f"{path} is not an opening book")
+
+    def _key_at(self, index):
+        return struct.unpack_from("<Q", self.data, HEADER.size + index * ENTRY.size)[0]
+
+    def probe_key(self, key):
+        low = 0
+        high = self.size
+        while low < high:
+            middle = (low + high) // 2
+            if self._key_at(middle) < key:
+                low = middle + 1
+            else:
+                high = middle
+        if low == self.size or self._key_at(low) != key:
+            return None
+        return BookEntry(*ENTRY.unpack_from(self.data, HEADER.size + low * ENTRY.size)[1:])
+
+    def probe(self, state):
+        return self.probe_key(hash_state(state))
+
+    def book_moves(self, state, color):
+        # Every successor the book has seen, most played first
+        moves = [(new_state, self.probe(new_state)) for new_state in find_successor_states(state, color)]
+        return sorted([(new_state, entry) for new_state, entry in moves if entry is not None],
+                      key=lambda move: -move[1].games)
+
+    def close(self):
+        self.data.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
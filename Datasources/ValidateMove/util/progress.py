@@ -0,0 +1,16 @@
+import os
+
+from .bitboard import Position, decode_move
+from .move import CAPTURE_FLAG, PIECE_TYPE_MASK, PIECE_TYPE_SHIFT
+
+# Moves in a row, counting both players, without a capture or a man move before the game is drawn
+NO_PROGRESS_LIMIT = int(os.environ.get("NO_PROGRESS_LIMIT", 80))
+
+
+def is_progress_move(old_game_state, new_game_state):
+    # A capture or a man move can never be undone, so no position from before it can come back
+    move = decode_move(Position.from_state(old_game_state), Position.from_state(new_game_state))
+    if move is None:
+        # Only a multi-jump capture chain spans more than one hop
+        return True
+    return bool(move & CAPTURE_FLAG) or (move >> PIECE_TYPE_SHIFT & PIECE_TYPE_MASK) in (1, 3)
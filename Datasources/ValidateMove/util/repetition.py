@@ -0,0 +1,7 @@
+from .zobrist import hash_state
+
+REPETITION_LIMIT = 3
+
+
+def position_key(state):
+    return format(hash_state(state), "016x")
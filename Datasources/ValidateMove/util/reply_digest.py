@@ -0,0 +1,28 @@
+import hashlib
+
+DIGEST_SIZE = 8
+
+
+def state_digest(state):
+    # Zobrist keys are linear and public, so a crafted state could collide with them; a real hash can't be steered
+    return hashlib.blake2b(state.encode("ascii"), digest_size=DIGEST_SIZE).digest()
+
+
+def build_reply_digest(states):
+    return b"".join(sorted(state_digest(state) for state in states))
+
+
+def digest_contains(reply_digest, state):
+    target = state_digest(state)
+    low = 0
+    high = len(reply_digest) // DIGEST_SIZE
+    while low < high:
+        middle = (low + high) // 2
+        entry = reply_digest[middle * DIGEST_SIZE:(middle + 1) * DIGEST_SIZE]
+        if entry == target:
+            return True
+        if entry < target:
+            low = middle + 1
+        else:
+            high = middle
+    return False
@@ -0,0 +1,259 @@
+import time
+from dataclasses import dataclass, field
+
+from .bitboard import TURN_COLORS, Position, apply_move, find_packed_legal_moves, has_captures, has_legal_moves
+from .evaluation import positional_evaluation
+from .symmetry import flip_move
+from .transposition_table import EXACT, LOWER_BOUND, UPPER_BOUND, TranspositionTable
+from .zobrist import hash_mirrored_position, hash_position, update_hash
+
+WIN_SCORE = 1000000
+# Scores past this are wins or losses, counted from the root so that quicker wins score higher
+WIN_THRESHOLD = WIN_SCORE - 1000
+INFINITY = WIN_SCORE + 1
+# The clock is only read every this many nodes
+DEADLINE_CHECK_INTERVAL = 128
+MAX_DEPTH = 64
+
+
+class SearchTimeout(Exception):
+    pass
+
+
+@dataclass
+class SearchResult:
+    move: int
+    state: str
+    score: int
+    depth: int
+    nodes: int
+    principal_variation: list = field(default_factory=list)
+
+
+class Searcher:
+    def __init__(self, evaluate=positional_evaluation, table_bits=18, exact_depth=False, canonical=False,
+                 clock=time.perf_counter):
+        self.evaluate = evaluate
+        # Seconds from an arbitrary start, only ever compared with the deadline it set
+        self.clock = clock
+        self.table = TranspositionTable(table_bits)
+        # Only cut off on entries of the same depth, so the score doesn't depend on what was searched before
+        self.exact_depth = exact_depth
+        # Positions with black to move use the entry of their mirror image, which needs an evaluation that scores
+        # the mirror as the negation
+        self.canonical = canonical
+        self.nodes = 0
+        self.deadline = None
+
+    def search(self, state, depth):
+        position = Position.from_state(state)
+        self.nodes = 0
+        self.deadline = None
+        score, move = self._search_root(position, hash_position(position), depth, -INFINITY, INFINITY)
+        if move is None:
+            return None
+        new_state = apply_move(position, move, TURN_COLORS[position.turn]).to_state()
+        return SearchResult(move, new_state, score, depth, self.nodes)
+
+    def search_move(self, state, move, depth, alpha=-INFINITY):
+        # Scores a single root move; a score at or below alpha is only an upper bound
+        position = Position.from_state(state)
+        self.nodes = 0
+        self.deadline = None
+        return self._child_score(position, hash_position(position), move, TURN_COLORS[position.turn], depth, alpha,
+                                 INFINITY, 0)
+
+    def search_with_budget(self, state, budget_ms, max_depth=MAX_DEPTH):
+        # Iterative deepening, each depth starts from the moves the previous one left in the table
+        position = Position.from_state(state)
+        key = hash_position(position)
+        color = TURN_COLORS[position.turn]
+        moves = self._ordered_moves(position, color, key)
+        if not moves:
+            return None
+        self.nodes = 0
+        self.deadline = self.clock() + budget_ms / 1000
+        # Something is always ready to return, even if the first depth doesn't finish in time
+        result = SearchResult(moves[0], apply_move(position, moves[0], color).to_state(), 0, 0, 0)
+        if len(moves) == 1:
+            return result
+
+        try:
+            for depth in range(1, max_depth + 1):
+                score, move = self._search_root(position, key, depth, -INFINITY, INFINITY)
+                result = SearchResult(move, apply_move(position, move, color).to_state(), score, depth, self.nodes,
+                                      self.principal_variation(position, key, depth))
+                if abs(score) > WIN_THRESHOLD:
+                    break
+        except SearchTimeout:
+            result.nodes = self.nodes
+        finally:
+            self.deadline = None
+        return result
+
+    def principal_variation(self, position, key, depth):
+        # Follows the best moves stored in the table, as far as they go
+        moves = []
+        while len(moves) < depth:
+            entry = self._probe(position, key)
+            color = TURN_COLORS[position.turn]
+            if entry is None or entry[3] not in find_packed_legal_moves(position, color):
+                break
+            move = entry[3]
+            child = apply_move(position, move, color)
+            key = update_hash(key, position, move, child)
+            position = child
+            moves.append(move)
+        return moves
+
+    def _probe(self, position, key):
+        # Scores are from the side to move, so only the move needs flipping back from the mirror's entry
+        if self.canonical and TURN_COLORS[position.turn] == "black":
+            entry = self.table.probe(hash_mirrored_position(position))
+            return None if entry is None else entry[:3] + (flip_move(entry[3]),)
+        return self.table.probe(key)
+
+    def _store(self, position, key, depth, score, bound, move):
+        if self.canonical and TURN_COLORS[position.turn] == "black":
+            self.table.store(hash_mirrored_position(position), depth, score, bound, flip_move(move))
+        else:
+            self.table.store(key, depth, score, bound, move)
+
+    def _count_node(self):
+        self.nodes += 1
+        if self.deadline is not None and self.nodes % DEADLINE_CHECK_INTERVAL == 0 \
+                and self.clock() > self.deadline:
+            raise SearchTimeout()
+
+    def _search_root(self, position, key, depth, alpha, beta):
+        color = TURN_COLORS[position.turn]
+        moves = self._ordered_moves(position, color, key)
+        best_score = -INFINITY
+        best_move = None
+        for move in moves:
+            score = self._child_score(position, key, move, color, depth, alpha, beta, 0)
+            if score > best_score:
+                best_score = score
+                best_move = move
+            if score > alpha:
+                alpha = score
+        if best_move is not None:
+            self._store(position, key, depth, best_score, EXACT, best_move)
+        return best_score, best_move
+
+    def _ordered_moves(self, position, color, key):
+        moves = find_packed_legal_moves(position, color)
+        entry = self._probe(position, key)
+        if entry is not None and entry[3] in moves:
+            moves = [entry[3]] + [move for move in moves if move != entry[3]]
+        return moves
+
+    def _child_score(self, position, key, move, color, depth, alpha, beta, ply):
+        child = apply_move(position, move, color)
+        child_key = update_hash(key, position, move, child)
+        # A continuing multi-jump is still the same player's move, so neither the side nor the depth changes
+        if child.continuation_square is not None:
+            return self._negamax(child, child_key, depth, alpha, beta, ply + 1)
+        return -self._negamax(child, child_key, depth - 1, -beta, -alpha, ply + 1)
+
+    def _negamax(self, position, key, depth, alpha, beta, ply):
+        if depth <= 0:
+            return self._quiescence(position, key, alpha, beta, ply)
+        self._count_node()
+
+        original_alpha = alpha
+        table_move = None
+        entry = self._probe(position, key)
+        if entry is not None:
+            entry_depth, entry_score, entry_bound, table_move = entry
+            if entry_depth == depth or entry_depth > depth and not self.exact_depth:
+                entry_score = _score_from_table(entry_score, ply)
+                if entry_bound == EXACT:
+                    return entry_score
+                if entry_bound == LOWER_BOUND:
+                    alpha = max(alpha, entry_score)
+                elif entry_bound == UPPER_BOUND:
+                    beta = min(beta, entry_score)
+                if alpha >= beta:
+                    return entry_score
+
+        color = TURN_COLORS[position.turn]
+        moves = find_packed_legal_moves(position, color)
+        if not moves:
+            return -WIN_SCORE + ply
+        if table_move in moves:
+            moves = [table_move] + [move for move in moves if move != table_move]
+
+        best_score = -INFINITY
+        best_move = None
+        for move in moves:
+            score = self._child_score(position, key, move, color, depth, alpha, beta, ply)
+            if score > best_score:
+                best_score = score
+                best_move = move
+            if score > alpha:
+                alpha = score
+            if alpha >= beta:
+                break
+
+        if best_score <= original_alpha:
+            bound = UPPER_BOUND
+        elif best_score >= beta:
+            bound = LOWER_BOUND
+        else:
+            bound = EXACT
+        self._store(position, key, depth, _score_to_table(best_score, ply), bound, best_move)
+        return best_score
+
+    def _quiescence(self, position, key, alpha, beta, ply):
+        # Captures are forced, so a position is only scored once the side to move has none left
+        self._count_node()
+        color = TURN_COLORS[position.turn]
+        if not has_captures(position, color):
+            # A quiet side that can't move at all has lost, only a yes or no is needed to tell
+            if not has_legal_moves(position, color):
+                return -WIN_SCORE + ply
+            score = self.evaluate(position)
+            return score if color == "white" else -score
+
+        best_score = -INFINITY
+        for move in find_packed_legal_moves(position, color):
+            child = apply_move(position, move, color)
+            child_key = update_hash(key, position, move, child)
+            if child.continuation_square is not None:
+                score = self._quiescence(child, child_key, alpha, beta, ply + 1)
+            else:
+                score = -self._quiescence(child, child_key, -beta, -alpha, ply + 1)
+            if score > best_score:
+                best_score = score
+            if score > alpha:
+                alpha = score
+            if alpha >= beta:
+                break
+        return best_score
+
+
+def _score_to_table(score, ply):
+    # Wins are stored relative to the position rather than the root, so they stay right when reached another way
+    if score > WIN_THRESHOLD:
+        return score + ply
+    if score < -WIN_THRESHOLD:
+        return score - ply
+    return score
+
+
+def _score_from_table(score, ply):
+    if score > WIN_THRESHOLD:
+        return score - ply
+    if score < -WIN_THRESHOLD:
+        return score + ply
+    return score
+
+
+def choose_move(state, color, depth=6, searcher=None):
+    # Plays through the same state strings as makeMove, a multi-jump takes one call per hop
+    position = Position.from_state(state)
+    if TURN_COLORS[position.turn] != color:
+        raise ValueError(f"It is not {color}'s turn")
+    result = (searcher or Searcher()).search(state, depth)
+    return None if result is None else result.state
@@ -0,0 +1,97 @@
+import os
+from collections import OrderedDict
+
+from .bitboard import find_successor_states
+from .symmetry import flip_color, flip_state
+
+DEFAULT_SUCCESSOR_CACHE_SIZE = 4096
+
+
+class SuccessorCache:
+    def __init__(self, max_size=DEFAULT_SUCCESSOR_CACHE_SIZE, canonical=False):
+        self.max_size = max_size
+        # Black's positions are kept as their mirror image with white to move, so a position and its mirror share
+        # one entry
+        self.canonical = canonical
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _flipped(self, color):
+        return self.canonical and color == "black"
+
+    def _lookup(self, state, color):
+        key = (flip_state(state), flip_color(color)) if self._flipped(color) else (state, color)
+        successors = self._entries.get(key)
+        if successors is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return successors
+
+    def get(self, state, color):
+        # Hands back the whole set, which in canonical mode means flipping every state of a black position
+        successors = self._lookup(state, color)
+        if successors is not None and self._flipped(color):
+            return frozenset(map(flip_state, successors))
+        return successors
+
+    def contains(self, state, color, new_state):
+        # None when the state isn't cached; only the candidate is flipped, so a hit stays a single set lookup
+        successors = self._lookup(state, color)
+        if successors is None:
+            return None
+        if self._flipped(color):
+            try:
+                flipped_state = flip_state(new_state)
+            except ValueError:
+                return False
+            # Only well formed states flip one to one, anything that doesn't flip back to itself is no successor
+            if flip_state(flipped_state) != new_state:
+                return False
+            new_state = flipped_state
+        return new_state in successors
+
+    def successors(self, state, color):
+        successors = self.get(state, color)
+        if successors is None:
+            successors = frozenset(find_successor_states(state, color))
+            self.put(state, color, successors)
+        return successors
+
+    def put(self, state, color, successors):
+        if self.max_size <= 0:
+            return
+        if self._flipped(color):
+            state, color, successors = flip_state(state), flip_color(color), frozenset(map(flip_state, successors))
+        key = (state, color)
+        self._entries[key] = successors
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def stats(self):
+        return {
+            "size": len(self._entries),
+            "maxSize": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions
+        }
+
+
+# Shared by every invocation that lands on the same warm Lambda container
+SUCCESSOR_CACHE = SuccessorCache(int(os.environ.get("SUCCESSOR_CACHE_SIZE", DEFAULT_SUCCESSOR_CACHE_SIZE)),
+                                 os.environ.get("SUCCESSOR_CACHE_CANONICAL", "false").lower() == "true")
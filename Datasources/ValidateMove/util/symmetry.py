@@ -0,0 +1,57 @@
+from .bitboard import CONTINUATION_TURNS, Position
+from .move import CAPTURE_FLAG, CAPTURE_SHIFT, END_SHIFT, PIECE_TYPE_MASK, PIECE_TYPE_SHIFT, SQUARE_MASK
+
+# Turning the board half a turn and swapping the colours gives the same game with the other side to move, square s
+# becoming square 31 - s
+PIECE_FLIP = str.maketrans("1234", "3412")
+TURN_FLIP = {"0": "1", "1": "0", "2": "3", "3": "2"}
+PIECE_TYPE_FLIP = (0, 3, 4, 1, 2)
+COLOR_FLIP = {"white": "black", "black": "white"}
+# Positions with white to move are the ones stored, a position with black to move is looked up as its mirror
+CANONICAL_TURNS = ("1", "3")
+BYTE_REVERSE = [int(format(value, "08b")[::-1], 2) for value in range(256)]
+
+
+def reverse_bits(bits):
+    return BYTE_REVERSE[bits & 0xFF] << 24 | BYTE_REVERSE[bits >> 8 & 0xFF] << 16 \
+        | BYTE_REVERSE[bits >> 16 & 0xFF] << 8 | BYTE_REVERSE[bits >> 24]
+
+
+def flip_state(state):
+    turn = state[32:33]
+    flipped = state[31::-1].translate(PIECE_FLIP) + TURN_FLIP.get(turn, turn)
+    if turn in CONTINUATION_TURNS:
+        flipped += str(31 - int(state[33:]))
+    return flipped
+
+
+def flip_position(position):
+    continuation_square = position.continuation_square
+    return Position(reverse_bits(position.black), reverse_bits(position.white), reverse_bits(position.kings),
+                    TURN_FLIP.get(position.turn, position.turn),
+                    None if continuation_square is None else 31 - continuation_square)
+
+
+def flip_move(move):
+    start = 31 - (move & SQUARE_MASK)
+    end = 31 - (move >> END_SHIFT & SQUARE_MASK)
+    piece_type = PIECE_TYPE_FLIP[move >> PIECE_TYPE_SHIFT & PIECE_TYPE_MASK]
+    flipped = start | end << END_SHIFT | piece_type << PIECE_TYPE_SHIFT
+    if move & CAPTURE_FLAG:
+        flipped |= (31 - (move >> CAPTURE_SHIFT & SQUARE_MASK)) << CAPTURE_SHIFT | CAPTURE_FLAG
+    return flipped
+
+
+def flip_color(color):
+    return COLOR_FLIP[color]
+
+
+def is_canonical(state):
+    return state[32:33] in CANONICAL_TURNS
+
+
+def canonical_state(state):
+    # The state to store under and whether it was flipped to get there
+    if is_canonical(state):
+        return state, False
+    return flip_state(state), True
@@ -0,0 +1,166 @@
+import mmap
+import os
+import struct
+from math import comb
+
+from .bitboard import Position
+from .symmetry import flip_position
+
+MAGIC = b"CKTB"
+VERSION = 1
+# magic, version, white men, white kings, black men, black kings, flags, padding, number of entries
+HEADER = struct.Struct("<4sBBBBBB2xI")
+# Only positions with white to move are stored, black's are probed as their mirror image in the mirrored slice
+CANONICAL_FLAG = 1
+# Men never stand on the row where they would have been promoted
+WHITE_MAN_SQUARES = 0x0FFFFFFF
+BLACK_MAN_SQUARES = 0xFFFFFFF0
+BLACK_MAN_OFFSET_SQUARES = 0x0000000F
+
+# One byte per position: 0 for an index no position maps to, 1 for a draw, then even codes for wins and odd codes
+# for losses of the side to move, counting plies to the end of the game with a multi-jump as one ply
+INVALID = 0
+DRAW = 1
+MAX_DISTANCE = 125
+WIN = "WIN"
+LOSS = "LOSS"
+DRAW_RESULT = "DRAW"
+
+
+def win_code(distance):
+    return 2 + 2 * distance
+
+
+def loss_code(distance):
+    return 3 + 2 * distance
+
+
+def decode_value(code):
+    if code == INVALID:
+        return None
+    if code == DRAW:
+        return DRAW_RESULT, None
+    return (WIN if code % 2 == 0 else LOSS), (code - 2) // 2
+
+
+def _count(bits):
+    return bin(bits).count("1")
+
+
+def material_of(position):
+    kings = position.kings
+    return (_count(position.white & ~kings), _count(position.white & kings),
+            _count(position.black & ~kings), _count(position.black & kings))
+
+
+def slice_size(material):
+    white_men, white_kings, black_men, black_kings = material
+    free_squares = 32 - white_men - black_men
+    return comb(28, white_men) * comb(28, black_men) * comb(free_squares, white_kings) \
+        * comb(free_squares - white_kings, black_kings) * 2
+
+
+def flip_material(material):
+    white_men, white_kings, black_men, black_kings = material
+    return black_men, black_kings, white_men, white_kings
+
+
+def slice_file_name(material):
+    return "{:02}{:02}{:02}{:02}.tb".format(*material)
+
+
+def _rank(bits, blocked):
+    # Combinatorial number system rank of the set squares, counted among the squares that aren't blocked
+    rank = 0
+    count = 0
+    while bits:
+        lowest = bits & -bits
+        count += 1
+        rank += comb(lowest.bit_length() - 1 - _count(blocked & (lowest - 1)), count)
+        bits ^= lowest
+    return rank
+
+
+def position_index(position):
+    # Men first, each colour among the squares it can stand on, then kings among the squares still free
+    kings = position.kings
+    white_men = position.white & ~kings
+    black_men = position.black & ~kings
+    white_kings = position.white & kings
+    black_kings = position.black & kings
+    if white_men & ~WHITE_MAN_SQUARES or black_men & ~BLACK_MAN_SQUARES:
+        return None
+    white_men_count, white_kings_count, black_men_count, _ = material_of(position)
+    men = white_men | black_men
+    free_squares = 32 - white_men_count - black_men_count
+
+    index = _rank(white_men, 0)
+    index = index * comb(28, black_men_count) + _rank(black_men, BLACK_MAN_OFFSET_SQUARES)
+    index = index * comb(free_squares, white_kings_count) + _rank(white_kings, men)
+    index = index * comb(free_squares - white_kings_count, _count(black_kings)) + _rank(black_kings, men | white_kings)
+    return index * 2 + (1 if position.turn == "1" else 0)
+
+
+def read_header(data):
+    magic, version, white_men, white_kings, black_men, black_kings, flags, size = HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("Not a tablebase file")
+    return (white_men, white_kings, black_men, black_kings), flags, size
+
+
+class Tablebase:
+    # Slice files are mapped on first use, nothing is read or parsed up front
+    def __init__(self, directory, canonical=False):
+        self.directory = directory
+        self.canonical = canonical
+        self.slices = {}
+
+    def _slice(self, material):
+        if material not in self.slices:
+            path = os.path.join(self.directory, slice_file_name(material))
+            data = None
+            if os.path.exists(path):
+                with open(path, "rb") as slice_file:
+                    data = mmap.mmap(slice_file.fileno(), 0, access=mmap.ACCESS_READ)
+                flags = CANONICAL_FLAG if self.canonical else 0
+                size = slice_size(material) // 2 if self.canonical else slice_size(material)
+                if read_header(data) != (material, flags, size) or len(data) != HEADER.size + size:
+                    data.close()
+                    raise ValueError(f"Tablebase file {path} does not match its material")
+            self.slices[material] = data
+        return self.slices[material]
+
+    def probe_code(self, position):
+        # None when the position isn't covered: a continuation, too many pieces or a slice not generated
+        if position.continuation_square is not None or position.turn not in ("0", "1"):
+            return None
+        material = material_of(position)
+        white_pieces = material[0] + material[1]
+        black_pieces = material[2] + material[3]
+        if (black_pieces if position.turn == "0" else white_pieces) == 0:
+            return loss_code(0)
+        if white_pieces == 0 or black_pieces == 0:
+            return None
+        if self.canonical and position.turn == "0":
+            position = flip_position(position)
+            material = flip_material(material)
+        data = self._slice(material)
+        if data is None:
+            return None
+        index = position_index(position)
+        if index is None:
+            return None
+        return data[HEADER.size + (index // 2 if self.canonical else index)]
+
+    def probe_position(self, position):
+        code = self.probe_code(position)
+        return None if code is None else decode_value(code)
+
+    def probe(self, state):
+        return self.probe_position(Position.from_state(state))
+
+    def close(self):
+        for data in self.slices.values():
+            if data is not None:
+                data.close()
+        self.slices = {}
@@ -0,0 +1,35 @@
+EXACT = 0
+LOWER_BOUND = 1
+UPPER_BOUND = 2
+
+
+class TranspositionTable:
+    # A fixed number of slots indexed by the low bits of the position hash, so memory stays bounded
+    def __init__(self, size_bits=18):
+        self.mask = (1 << size_bits) - 1
+        self.keys = [None] * (self.mask + 1)
+        self.entries = [None] * (self.mask + 1)
+        self.hits = 0
+        self.probes = 0
+
+    def probe(self, key):
+        self.probes += 1
+        index = key & self.mask
+        if self.keys[index] == key:
+            self.hits += 1
+            return self.entries[index]
+        return None
+
+    def store(self, key, depth, score, bound, move):
+        index = key & self.mask
+        # A shallower result for the same position never replaces a deeper one
+        if self.keys[index] == key and self.entries[index][0] > depth:
+            return
+        self.keys[index] = key
+        self.entries[index] = (depth, score, bound, move)
+
+    def clear(self):
+        self.keys = [None] * (self.mask + 1)
+        self.entries = [None] * (self.mask + 1)
+        self.hits = 0
+        self.probes = 0
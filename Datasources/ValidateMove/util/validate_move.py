@@ -1,9 +1,7 @@
+from . import bitboard
+from .bitboard import FORWARD_LEFT, FORWARD_RIGHT, BACK_LEFT, BACK_RIGHT, NEIGHBOURS, JUMPS
 from .move import Move
-
-FORWARD_LEFT = "forward_left"
-FORWARD_RIGHT = "forward_right"
-BACK_LEFT = "back_left"
-BACK_RIGHT = "back_right"
+from .successor_cache import SUCCESSOR_CACHE
 
 DIRECTION_MAPPING = {
     "forward_left": {"correction": -4, "row_change": 1},
@@ -28,6 +26,33 @@ class MoveValidator:
         self.set_turn_states()
 
     def find_all_valid_new_states(self):
+        return bitboard.find_successor_states(self.old_game_state, self.move_requester_color)
+
+    def find_valid_moves(self):
+        # Complete moves, so every hop of a multi-jump with the state it leaves
+        if not self.validate_turn_state():
+            return []
+        return [([Move.from_packed(move) for move in moves], list(states))
+                for moves, states in bitboard.find_complete_moves_with_states(self.old_game_state,
+                                                                              self.move_requester_color)]
+
+    def validate_new_state(self, new_state):
+        if not self.validate_turn_state():
+            return False
+        cached = SUCCESSOR_CACHE.contains(self.old_game_state, self.move_requester_color, new_state)
+        if cached is not None:
+            return cached
+        return bitboard.is_valid_transition(self.old_game_state, new_state, self.move_requester_color)
+
+    def validate_capture_chain(self, new_state):
+        if not self.validate_turn_state():
+            return None
+        for chain_states in bitboard.find_capture_chain_states(self.old_game_state, self.move_requester_color):
+            if chain_states[-1] == new_state:
+                return list(chain_states)
+        return None
+
+    def find_all_valid_new_states_by_scanning(self):
         continuation_moves = self.find_continuation_states()
         if continuation_moves:
             return continuation_moves
@@ -38,11 +63,6 @@ class MoveValidator:
 
         return self.find_regular_move_states()
 
-    def validate_new_state(self, new_state):
-        if not self.validate_turn_state():
-            return False
-        return new_state in self.find_all_valid_new_states()
-
     def find_regular_move_states(self):
         moves = self.find_regular_moves()
         result = []
@@ -75,7 +95,7 @@ class MoveValidator:
         result = []
 
         for direction in directions:
-            neighbour_square = self.get_index_of_neighbour(index, direction)
+            neighbour_square = NEIGHBOURS[direction][index]
             if neighbour_square is None:
                 continue
             if self.old_game_state[neighbour_square] == "0":
@@ -169,31 +189,24 @@ class MoveValidator:
         directions = self.get_directions(piece_type)
         result = []
 
+        if piece_type == 3 or piece_type == 4:
+            opponent_pieces = ("1", "2")
+        elif piece_type == 1 or piece_type == 2:
+            opponent_pieces = ("3", "4")
+        else:
+            return result
+
         for direction in directions:
-            neighbour_square = self.get_index_of_neighbour(index, direction)
-            if neighbour_square is None:
+            jump = JUMPS[direction][index]
+            if jump is None:
                 continue
-            if (self.old_game_state[neighbour_square] == "1" or self.old_game_state[neighbour_square] == "2") and (piece_type == 3 or piece_type == 4):
-                behind_neighbour = self.get_index_of_neighbour(neighbour_square, direction)
-                if behind_neighbour is None:
-                    continue
-                if self.old_game_state[behind_neighbour] == "0":
-                    result.append(Move(piece_start_location=index,
-                                       piece_end_location=behind_neighbour,
-                                       capture_location=neighbour_square,
-                                       piece_type=piece_type
-                                       ))
-
-            if (self.old_game_state[neighbour_square] == "3" or self.old_game_state[neighbour_square] == "4") and (piece_type == 1 or piece_type == 2):
-                behind_neighbour = self.get_index_of_neighbour(neighbour_square, direction)
-                if behind_neighbour is None:
-                    continue
-                if self.old_game_state[behind_neighbour] == "0":
-                    result.append(Move(piece_start_location=index,
-                                       piece_end_location=behind_neighbour,
-                                       capture_location=neighbour_square,
-                                       piece_type=piece_type
-                                       ))
+            neighbour_square, behind_neighbour = jump
+            if self.old_game_state[neighbour_square] in opponent_pieces and self.old_game_state[behind_neighbour] == "0":
+                result.append(Move(piece_start_location=index,
+                                   piece_end_location=behind_neighbour,
+                                   capture_location=neighbour_square,
+                                   piece_type=piece_type
+                                   ))
         return result
 
     @staticmethod
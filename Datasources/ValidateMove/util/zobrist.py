@@ -0,0 +1,93 @@
+import random
+
+from .bitboard import Position
+from .move import CAPTURE_FLAG, CAPTURE_SHIFT, END_SHIFT, PIECE_TYPE_MASK, PIECE_TYPE_SHIFT, SQUARE_MASK
+
+ZOBRIST_SEED = 20220614
+HASH_BITS = 64
+
+
+def _build_keys(seed):
+    rng = random.Random(seed)
+    piece_keys = [[0] * 32] + [[rng.getrandbits(HASH_BITS) for _ in range(32)] for _ in range(4)]
+    turn_keys = {turn: rng.getrandbits(HASH_BITS) for turn in "0123"}
+    continuation_keys = [rng.getrandbits(HASH_BITS) for _ in range(32)]
+    return piece_keys, turn_keys, continuation_keys
+
+
+# piece type -> square -> key, piece type 0 (empty) hashes to 0
+PIECE_KEYS, TURN_KEYS, CONTINUATION_KEYS = _build_keys(ZOBRIST_SEED)
+
+
+def _build_byte_keys(piece_keys):
+    # piece type -> byte of the bitboard -> byte value -> XOR of the keys of every set bit
+    byte_keys = [None]
+    for piece_type in range(1, 5):
+        tables = []
+        for byte_index in range(4):
+            table = [0] * 256
+            for value in range(1, 256):
+                lowest = value & -value
+                square = byte_index * 8 + lowest.bit_length() - 1
+                table[value] = table[value ^ lowest] ^ piece_keys[piece_type][square]
+            tables.append(table)
+        byte_keys.append(tables)
+    return byte_keys
+
+
+BYTE_KEYS = _build_byte_keys(PIECE_KEYS)
+# The key each piece would have on the board turned half a turn with the colours swapped
+MIRRORED_BYTE_KEYS = _build_byte_keys([PIECE_KEYS[piece_type][::-1] for piece_type in (0, 3, 4, 1, 2)])
+MIRRORED_TURN_KEYS = {turn: TURN_KEYS[mirrored_turn] for turn, mirrored_turn in zip("0123", "1032")}
+
+
+def _hash_bits(bits, piece_type, byte_keys):
+    first, second, third, fourth = byte_keys[piece_type]
+    return first[bits & 0xFF] ^ second[bits >> 8 & 0xFF] ^ third[bits >> 16 & 0xFF] ^ fourth[bits >> 24]
+
+
+def _hash_pieces(position, byte_keys):
+    kings = position.kings
+    return _hash_bits(position.white & ~kings, 1, byte_keys) ^ _hash_bits(position.white & kings, 2, byte_keys) \
+        ^ _hash_bits(position.black & ~kings, 3, byte_keys) ^ _hash_bits(position.black & kings, 4, byte_keys)
+
+
+def hash_position(position):
+    key = _hash_pieces(position, BYTE_KEYS)
+    key ^= TURN_KEYS.get(position.turn, 0)
+    if position.continuation_square is not None:
+        key ^= CONTINUATION_KEYS[position.continuation_square]
+    return key
+
+
+def hash_mirrored_position(position):
+    # Same as hashing the position turned half a turn with the colours swapped, without building it
+    key = _hash_pieces(position, MIRRORED_BYTE_KEYS)
+    key ^= MIRRORED_TURN_KEYS.get(position.turn, 0)
+    if position.continuation_square is not None:
+        key ^= CONTINUATION_KEYS[31 - position.continuation_square]
+    return key
+
+
+def hash_state(state):
+    return hash_position(Position.from_state(state))
+
+
+def update_hash(key, position, move, new_position):
+    # Hash of new_position = apply_move(position, move, colour), given key = hash_position(position)
+    start = move & SQUARE_MASK
+    end = move >> END_SHIFT & SQUARE_MASK
+    piece_type = move >> PIECE_TYPE_SHIFT & PIECE_TYPE_MASK
+    new_piece_type = 2 if piece_type == 1 and end >= 28 else 4 if piece_type == 3 and end <= 3 else piece_type
+
+    key ^= PIECE_KEYS[piece_type][start] ^ PIECE_KEYS[new_piece_type][end]
+    if move & CAPTURE_FLAG:
+        captured = move >> CAPTURE_SHIFT & SQUARE_MASK
+        key ^= PIECE_KEYS[position.piece_type_at(captured)][captured]
+
+    key ^= TURN_KEYS.get(position.turn, 0) ^ TURN_KEYS.get(new_position.turn, 0)
+    if position.continuation_square is not None:
+        key ^= CONTINUATION_KEYS[position.continuation_square]
+    if new_position.continuation_square is not None:
+        key ^= CONTINUATION_KEYS[new_position.continuation_square]
+    return key